@@ -6,6 +6,7 @@ import collections
 import hashlib
 import json
 import os
+import re
 import sqlite3
 import typing
 from copy import deepcopy
@@ -61,6 +62,7 @@ class LocalIndex:
     # but also search-based retrieval using only colrev_ids
 
     RECORD_INDEX = "record_index"
+    RECORD_FTS_INDEX = "record_index_fts"
     TOC_INDEX = "toc_index"
     UPDATE_LAYERD_FIELDS_QUERY = """
             UPDATE record_index SET
@@ -74,6 +76,37 @@ class LocalIndex:
         RECORD_INDEX: "SELECT * FROM record_index WHERE",
     }
 
+    # Note : substring-searches (title LIKE '%...%') are answered by the trigram
+    # full-text index (instead of a full table scan). The trigram tokenizer also
+    # folds non-ASCII case (LIKE does not), i.e., the MATCH selects a superset
+    # of candidates, which are filtered with the original LIKE.
+    SELECT_FTS_TITLE_QUERY = (
+        "SELECT record_index.* FROM record_index "
+        "JOIN record_index_fts ON record_index.rowid = record_index_fts.rowid "
+        "WHERE record_index_fts MATCH ? AND record_index.title LIKE ? "
+        "ORDER BY record_index.rowid"
+    )
+    SELECT_TABLE_EXISTS_QUERY = (
+        "SELECT name FROM sqlite_master WHERE type='table' AND name=?"
+    )
+    FTS_TRIGGER_QUERIES = [
+        """CREATE TRIGGER record_index_ai AFTER INSERT ON record_index BEGIN
+            INSERT INTO record_index_fts(rowid, title) VALUES (new.rowid, new.title);
+        END""",
+        """CREATE TRIGGER record_index_ad AFTER DELETE ON record_index BEGIN
+            INSERT INTO record_index_fts(record_index_fts, rowid, title)
+            VALUES ('delete', old.rowid, old.title);
+        END""",
+        """CREATE TRIGGER record_index_au AFTER UPDATE ON record_index BEGIN
+            INSERT INTO record_index_fts(record_index_fts, rowid, title)
+            VALUES ('delete', old.rowid, old.title);
+            INSERT INTO record_index_fts(rowid, title) VALUES (new.rowid, new.title);
+        END""",
+    ]
+    __title_like_query = re.compile(
+        r"^\s*title\s+LIKE\s+'%([^%_']{3,})%'\s*$", flags=re.IGNORECASE
+    )
+
     SELECT_KEY_QUERIES = {
         (RECORD_INDEX, "id"): "SELECT * FROM record_index WHERE id=?",
         (TOC_INDEX, "toc_key"): "SELECT * FROM toc_index WHERE toc_key=?",
@@ -122,10 +155,15 @@ class LocalIndex:
         self.__index_tei = index_tei
 
         self.thread_lock = Lock()
+        # Note : determined on first search (indexes created before the
+        # full-text index was added do not have the table)
+        self.__fts_index_available: typing.Optional[bool] = None
 
     def __get_sqlite_cursor(self, *, init: bool = False) -> sqlite3.Cursor:
         if init:
-            Path(self.SQLITE_PATH).unlink(missing_ok=True)
+            # Note : the write-ahead-log files must be removed with the database
+            for suffix in ["", "-wal", "-shm"]:
+                Path(f"{self.SQLITE_PATH}{suffix}").unlink(missing_ok=True)
 
         self.sqlite_connection = sqlite3.connect(self.SQLITE_PATH, timeout=90)
         self.sqlite_connection.row_factory = self.__dict_factory
@@ -283,36 +321,35 @@ class LocalIndex:
                 toc_key_full = colrev.record.Record(
                     data=internal_record_dict
                 ).get_toc_key()
-
-                if self.__toc_exists(toc_item=toc_key_full):
-                    return fields_to_remove
             except colrev_exceptions.NotTOCIdentifiableException:
                 return fields_to_remove
+
             wo_nr = deepcopy(internal_record_dict)
             del wo_nr["number"]
-            toc_key_wo_nr = colrev.record.Record(data=wo_nr).get_toc_key()
-
-            if toc_key_wo_nr != "NA":
-                if self.__toc_exists(toc_item=toc_key_wo_nr):
-                    fields_to_remove.append("number")
-                    return fields_to_remove
-
             wo_vol = deepcopy(internal_record_dict)
             del wo_vol["volume"]
-            toc_key_wo_vol = colrev.record.Record(data=wo_vol).get_toc_key()
-            if toc_key_wo_vol != "NA":
-                if self.__toc_exists(toc_item=toc_key_wo_vol):
-                    fields_to_remove.append("volume")
-                    return fields_to_remove
-
             wo_vol_nr = deepcopy(internal_record_dict)
             del wo_vol_nr["volume"]
             del wo_vol_nr["number"]
-            toc_key_wo_vol_nr = colrev.record.Record(data=wo_vol_nr).get_toc_key()
-            if toc_key_wo_vol_nr != "NA":
-                if self.__toc_exists(toc_item=toc_key_wo_vol_nr):
-                    fields_to_remove.append("number")
-                    fields_to_remove.append("volume")
+            toc_keys_fields_to_remove = [
+                (colrev.record.Record(data=wo_nr).get_toc_key(), ["number"]),
+                (colrev.record.Record(data=wo_vol).get_toc_key(), ["volume"]),
+                (
+                    colrev.record.Record(data=wo_vol_nr).get_toc_key(),
+                    ["number", "volume"],
+                ),
+            ]
+
+            # Note : the candidate tocs are looked up in one query (instead of one per toc)
+            existing_tocs = self.__get_existing_tocs(
+                toc_items=[toc_key_full]
+                + [toc_key for toc_key, _ in toc_keys_fields_to_remove]
+            )
+            if toc_key_full in existing_tocs:
+                return fields_to_remove
+            for toc_key, toc_fields_to_remove in toc_keys_fields_to_remove:
+                if toc_key != "NA" and toc_key in existing_tocs:
+                    fields_to_remove.extend(toc_fields_to_remove)
                     return fields_to_remove
 
         return fields_to_remove
@@ -555,6 +592,24 @@ class LocalIndex:
 
         return record_dict
 
+    def __fts_index_exists(self, *, cur: sqlite3.Cursor) -> bool:
+        if self.__fts_index_available is None:
+            cur.execute(self.SELECT_TABLE_EXISTS_QUERY, (self.RECORD_FTS_INDEX,))
+            self.__fts_index_available = cur.fetchone() is not None
+        return self.__fts_index_available
+
+    def __execute_search_query(self, *, cur: sqlite3.Cursor, query: str) -> None:
+        title_like_match = self.__title_like_query.match(query)
+        if title_like_match and self.__fts_index_exists(cur=cur):
+            search_term = title_like_match.group(1)
+            phrase = search_term.replace('"', '""')
+            cur.execute(
+                self.SELECT_FTS_TITLE_QUERY,
+                (f'title : "{phrase}"', f"%{search_term}%"),
+            )
+            return
+        cur.execute(f"{self.SELECT_ALL_QUERIES[self.RECORD_INDEX] } {query}")
+
     def search(self, *, query: str) -> list[colrev.record.Record]:
         """Run a search for records"""
 
@@ -563,7 +618,7 @@ class LocalIndex:
             self.thread_lock.acquire(timeout=60)
             cur = self.__get_sqlite_cursor()
             selected_row = None
-            cur.execute(f"{self.SELECT_ALL_QUERIES[self.RECORD_INDEX] } {query}")
+            self.__execute_search_query(cur=cur, query=query)
             for row in cur.fetchall():
                 selected_row = row
 
@@ -866,16 +921,44 @@ class LocalIndex:
         # Note : the tei-directory should be removed manually.
 
         cur = self.__get_sqlite_cursor(init=True)
+        # Note : journal_mode=WAL is persisted in the database file
+        # (the connections, which are opened per query, do not need to set it)
+        cur.execute("PRAGMA journal_mode=WAL")
         cur.execute(f"drop table if exists {self.RECORD_INDEX}")
         cur.execute(
             f"CREATE TABLE {self.RECORD_INDEX}(id TEXT PRIMARY KEY, "
             + ",".join(self.RECORDS_INDEX_KEYS[1:])
             + ")"
         )
+        # Note : B-tree indexes for the key-based retrieval (SELECT_KEY_QUERIES)
+        # instead of full table scans
+        for key in self.global_keys:
+            cur.execute(
+                f"CREATE INDEX {self.RECORD_INDEX}_{key} ON {self.RECORD_INDEX}({key})"
+            )
+        cur.execute(f"drop table if exists {self.RECORD_FTS_INDEX}")
+        try:
+            cur.execute(
+                f"CREATE VIRTUAL TABLE {self.RECORD_FTS_INDEX} USING fts5(title, "
+                f"content='{self.RECORD_INDEX}', content_rowid='rowid', "
+                "tokenize='trigram')"
+            )
+            for fts_trigger_query in self.FTS_TRIGGER_QUERIES:
+                cur.execute(fts_trigger_query)
+        except sqlite3.OperationalError:
+            # Note : fts5/trigram requires sqlite>=3.34 (search falls back to LIKE)
+            pass
+        self.__fts_index_available = None
         cur.execute(f"drop table if exists {self.TOC_INDEX}")
         cur.execute(
             f"CREATE TABLE {self.TOC_INDEX}(toc_key TEXT PRIMARY KEY, colrev_ids)"
         )
+        # Note : the NOCASE index enables index-seeks for (case-insensitive)
+        # prefix-queries (toc_key LIKE 'prefix%')
+        cur.execute(
+            f"CREATE INDEX {self.TOC_INDEX}_toc_key_nocase "
+            f"ON {self.TOC_INDEX}(toc_key COLLATE NOCASE)"
+        )
         if self.sqlite_connection:
             self.sqlite_connection.commit()
 
@@ -1044,6 +1127,24 @@ class LocalIndex:
             return False
         return False
 
+    def __get_existing_tocs(self, *, toc_items: list) -> set:
+        try:
+            self.thread_lock.acquire(timeout=60)
+            cur = self.__get_sqlite_cursor()
+            cur.execute(
+                f"SELECT toc_key FROM {self.TOC_INDEX} WHERE toc_key IN "
+                f"({', '.join('?' * len(toc_items))})",
+                toc_items,
+            )
+            existing_tocs = {row["toc_key"] for row in cur.fetchall()}
+            self.thread_lock.release()
+            return existing_tocs
+        except sqlite3.OperationalError:
+            self.thread_lock.release()
+        except AttributeError:  # ie. no sqlite database available
+            return set()
+        return set()
+
     def __get_toc_items_for_toc_retrieval(
         self, *, toc_key: str, search_across_tocs: bool
     ) -> list:
@@ -1320,7 +1421,7 @@ class LocalIndex:
 
             # Easy case: the initial colrev_ids overlap => duplicate
             initial_colrev_ids_overlap = not set(record1_colrev_id).isdisjoint(
-                list(record2_colrev_id)
+                record2_colrev_id
             )
             if initial_colrev_ids_overlap:
                 return "yes"
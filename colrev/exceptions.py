@@ -486,9 +486,14 @@ class InvalidPDFException(CoLRevException):
     """The PDF is invalid (empty, encrypted or broken)."""
 
     def __init__(self, path: Path) -> None:
+        self.path = path
         self.message = f"Invalid PDF (empty/broken): {path}"
         super().__init__(self.message)
 
+    def __reduce__(self) -> tuple:
+        # Note : rebuilt from the path when unpickled (e.g., raised in mp.Pool workers)
+        return (self.__class__, (self.path,))
+
 
 class PDFHashError(CoLRevException):
     """An error occurred during PDF hashing."""
@@ -2,9 +2,13 @@
 """Simple dedupe functionality (based on similarity thresholds) for small samples"""
 from __future__ import annotations
 
+import logging
+import multiprocessing as mp
 from dataclasses import dataclass
+from functools import partial
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 import zope.interface
 from dataclasses_jsonschema import JsonSchemaMixin
@@ -21,6 +25,78 @@ if TYPE_CHECKING:
 # pylint: disable=too-many-arguments
 # pylint: disable=too-few-public-methods
 
+# Note : parallel computation only pays off for larger queues
+PARALLEL_MIN_RECORDS = 200
+
+
+# Fields used by colrev.record.Record.get_similarity_detailed()
+SIMILARITY_FIELDS = (
+    "author",
+    "title",
+    "year",
+    "container_title",
+    "journal",
+    "volume",
+    "number",
+)
+
+
+# Note : module-level function (pickle-ability in multiprocessing)
+def calculate_similarity_row(
+    records_list: list, non_dup_threshold: float, item: tuple
+) -> np.ndarray:
+    """Calculate the similarities of a record with (candidate) prior records
+
+    item: (reference_index, candidate_indices), with candidate_indices=None
+    referring to all prior records in the queue
+
+    Pairs that cannot exceed the non_dup_threshold have the (upper bound of the)
+    similarity instead of the similarity (both are <= non_dup_threshold).
+    """
+    reference_index, candidate_indices = item
+    reference_record = records_list[reference_index]
+    if candidate_indices is None:
+        prior_records = records_list[:reference_index]
+    else:
+        prior_records = [records_list[j] for j in candidate_indices]
+
+    # Note: duplicates often have identical (prepared) metadata. The similarity
+    # is calculated once for each distinct set of values and reused.
+    similarities: dict = {}
+    row = np.empty(len(prior_records), dtype=float)
+    for j, prior_record in enumerate(prior_records):
+        key = tuple(prior_record.get(field) for field in SIMILARITY_FIELDS)
+        if key not in similarities:
+            # Note: skip the (expensive) similarity if the (cheap) upper bound
+            # shows that the pair would be considered a non-duplicate
+            similarity_upper_bound = colrev.record.Record.get_similarity_upper_bound(
+                df_a=prior_record, df_b=reference_record
+            )
+            if similarity_upper_bound <= non_dup_threshold:
+                similarities[key] = similarity_upper_bound
+            else:
+                similarities[key] = colrev.record.Record.get_similarity(
+                    df_a=prior_record, df_b=reference_record
+                )
+        row[j] = similarities[key]
+    return row
+
+
+def calculate_maximum_similarity(
+    records_list: list, non_dup_threshold: float, item: tuple
+) -> tuple:
+    """Calculate the maximum similarity of a record with (candidate) prior records
+
+    Returns (position, similarity), with the position referring to the
+    candidates (or prior records) and (-1, 0.0) if there are none.
+    """
+    row = calculate_similarity_row(records_list, non_dup_threshold, item)
+    if row.size == 0:
+        return -1, 0.0
+    # Note: argmax returns the first (prior) record with the maximum similarity
+    position = int(row.argmax())
+    return position, float(row[position])
+
 
 @zope.interface.implementer(colrev.env.package_manager.DedupePackageEndpointInterface)
 @dataclass
@@ -40,6 +116,7 @@ class SimpleDedupe(JsonSchemaMixin):
         endpoint: str
         merging_non_dup_threshold: float = 0.7
         merging_dup_threshold: float = 0.95
+        blocking_key: str = "none"
 
         _details = {
             "merging_non_dup_threshold": {
@@ -50,6 +127,10 @@ class SimpleDedupe(JsonSchemaMixin):
                 "tooltip": "Threshold: record pairs with a similarity "
                 "above this threshold are considered duplicates"
             },
+            "blocking_key": {
+                "tooltip": "Only compare records with the same blocking key "
+                "(none/author_year/title_prefix)"
+            },
         }
 
     settings_class = SimpleDedupeSettings
@@ -66,39 +147,133 @@ class SimpleDedupe(JsonSchemaMixin):
         assert self.settings.merging_non_dup_threshold <= 1.0
         assert self.settings.merging_dup_threshold >= 0.0
         assert self.settings.merging_dup_threshold <= 1.0
+        assert self.settings.blocking_key in ["none", "author_year", "title_prefix"]
+
+    def __get_blocking_key(self, *, record: dict) -> str:
+        if self.settings.blocking_key == "author_year":
+            first_author = record["author"].split(" and ")[0].split(",")[0]
+            return f"{first_author.strip().lower()}_{record['year']}"
+        # title_prefix (titles are lower-case after prep_records())
+        return "".join(record["title"].split())[:10]
+
+    def __build_blocking_keys(self, *, records_list: list) -> dict:
+        """Build the blocks ({key: [indices]}) of records that are compared"""
+        blocks: dict = {}
+        for i, record in enumerate(records_list):
+            blocks.setdefault(self.__get_blocking_key(record=record), []).append(i)
+        return blocks
+
+    def __get_candidate_indices(self, *, records_list: list) -> list:
+        """Get the indices of prior records that are compared to each record"""
+        if self.settings.blocking_key == "none":
+            return [None] * len(records_list)
+
+        candidate_indices: list = [[] for _ in records_list]
+        for block in self.__build_blocking_keys(records_list=records_list).values():
+            for position, i in enumerate(block):
+                candidate_indices[i] = block[:position]
+        return candidate_indices
+
+    def __calculate_maximum_similarities(self, *, records_list: list) -> tuple:
+        """Calculate the maximum similarity of each record with the prior records
+
+        Only the maximum similarity (and the index of the corresponding prior record)
+        is retained, in two buffers that are preallocated once for the queue:
+        max_similarities[i] and max_indices[i] refer to the prior record that is
+        most similar to record i (max_indices[i] is -1 if no prior record has a
+        similarity above 0).
+        With blocking, pairs of records in different blocks have a similarity of 0
+        (as pairs whose similarity cannot exceed the merging_non_dup_threshold).
+        """
+        n_records = len(records_list)
+        max_similarities = np.zeros(n_records, dtype=float)
+        max_indices = np.full(n_records, -1, dtype=int)
+        candidate_indices = self.__get_candidate_indices(records_list=records_list)
+        row_items = [(i, candidate_indices[i]) for i in range(1, n_records)]
+        calculate_row = partial(
+            calculate_maximum_similarity,
+            records_list,
+            self.settings.merging_non_dup_threshold,
+        )
+        if n_records < PARALLEL_MIN_RECORDS:
+            row_maxima = list(map(calculate_row, row_items))
+        else:
+            # Note: the rows are independent (and the computation is CPU-bound)
+            cpus = mp.cpu_count()
+            with mp.Pool(cpus) as pool:
+                row_maxima = pool.map(
+                    calculate_row,
+                    row_items,
+                    chunksize=max(1, n_records // (4 * cpus)),
+                )
+        for (i, candidates), (position, similarity) in zip(row_items, row_maxima):
+            if similarity > 0:
+                max_similarities[i] = similarity
+                max_indices[i] = (
+                    position if candidates is None else candidates[position]
+                )
+        return max_similarities, max_indices
 
     def __get_maximum_similarity_record(
         self,
         *,
-        dedupe_operation: colrev.ops.dedupe.Dedupe,  # pylint: disable=unused-argument
-        records_batch: list,
+        records_list: list,
+        reference_index: int,
+        max_similarities: np.ndarray,
+        max_indices: np.ndarray,
     ) -> dict:
         max_similarity_record = {
-            "reference_record": records_batch[len(records_batch) - 1]["ID"],
+            "reference_record": records_list[reference_index]["ID"],
             "record_id": "NA",
-            "similarity": 0,
+            "similarity": 0.0,
         }
-        for i in range(0, len(records_batch) - 1):
-            sim_details = colrev.record.Record.get_similarity_detailed(
-                record_a=records_batch[i],
-                record_b=records_batch[len(records_batch) - 1],
-            )
+        max_index = int(max_indices[reference_index])
 
-            if sim_details["score"] > max_similarity_record["similarity"]:
-                max_similarity_record["similarity"] = sim_details["score"]
-                max_similarity_record["record_id"] = records_batch[i]["ID"]
-                max_similarity_record["details"] = sim_details["details"]
+        if max_index >= 0:
+            max_similarity_record["similarity"] = float(
+                max_similarities[reference_index]
+            )
+            max_similarity_record["record_id"] = records_list[max_index]["ID"]
+            max_similarity_record["record_index"] = max_index
 
         return max_similarity_record
 
+    def __log_similarity_details(
+        self,
+        *,
+        dedupe_operation: colrev.ops.dedupe.Dedupe,
+        records_list: list,
+        reference_index: int,
+        similarity_dict: dict,
+    ) -> None:
+        logger = dedupe_operation.review_manager.logger
+        # Note: details are only computed (and formatted) in debug mode
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        sim_details = colrev.record.Record.get_similarity_detailed(
+            record_a=records_list[similarity_dict["record_index"]],
+            record_b=records_list[reference_index],
+        )
+        logger.debug(
+            f"max_similarity ({similarity_dict['similarity']}): "
+            f"{similarity_dict['reference_record']} {similarity_dict['record_id']}\n"
+            f"Details: {sim_details['details']}"
+        )
+
     def __append_merges(
-        self, *, dedupe_operation: colrev.ops.dedupe.Dedupe, batch_item: dict
+        self,
+        *,
+        dedupe_operation: colrev.ops.dedupe.Dedupe,
+        records_list: list,
+        batch_item: dict,
+        max_similarities: np.ndarray,
+        max_indices: np.ndarray,
     ) -> dict:
-        records_batch = batch_item["queue"]
+        reference_index = batch_item["index"]
 
         # if the record is the first one added to the records
         # (in a preceding processing step), it can be propagated
-        if len(records_batch) < 2:
+        if reference_index < 1:
             return {
                 "ID1": batch_item["record"],
                 "ID2": "NA",
@@ -108,9 +283,14 @@ class SimpleDedupe(JsonSchemaMixin):
 
         # df to get_similarities for each other record
         similarity_dict = self.__get_maximum_similarity_record(
-            dedupe_operation=dedupe_operation, records_batch=records_batch
+            records_list=records_list,
+            reference_index=reference_index,
+            max_similarities=max_similarities,
+            max_indices=max_indices,
         )
 
+        reference_id = similarity_dict["reference_record"]
+        other_id = similarity_dict["record_id"]
         max_similarity = similarity_dict["similarity"]
 
         ret = {}
@@ -121,7 +301,7 @@ class SimpleDedupe(JsonSchemaMixin):
             #     f"max_similarity ({max_similarity})"
             # )
             ret = {
-                "ID1": similarity_dict["reference_record"],
+                "ID1": reference_id,
                 "ID2": "NA",
                 "similarity": max_similarity,
                 "decision": "no_duplicate",
@@ -132,21 +312,21 @@ class SimpleDedupe(JsonSchemaMixin):
             < max_similarity
             < self.settings.merging_dup_threshold
         ):
-            other_id = similarity_dict["record_id"]
-            # dedupe_operation.review_manager.logger.debug(
-            #     f"max_similarity ({max_similarity}): {batch_item['record']} {other_id}"
-            # )
-            # details = similarity_dict["details"]
-            # dedupe_operation.review_manager.logger.debug(details)
+            self.__log_similarity_details(
+                dedupe_operation=dedupe_operation,
+                records_list=records_list,
+                reference_index=reference_index,
+                similarity_dict=similarity_dict,
+            )
             # record_a, record_b = sorted([ID, record["ID"]])
             msg = (
-                f'{similarity_dict["reference_record"]} - {other_id}'.ljust(35, " ")
+                f"{reference_id} - {other_id}".ljust(35, " ")
                 + f"  - potential duplicate (similarity: {max_similarity})"
             )
             # dedupe_operation.review_manager.report_logger.info(msg)
             dedupe_operation.review_manager.logger.info(msg)
             ret = {
-                "ID1": similarity_dict["reference_record"],
+                "ID1": reference_id,
                 "ID2": other_id,
                 "similarity": max_similarity,
                 "decision": "potential_duplicate",
@@ -156,34 +336,31 @@ class SimpleDedupe(JsonSchemaMixin):
             # note: the following status will not be saved in the bib file but
             # in the duplicate_tuples.csv (which will be applied to the bib file
             # in the end)
-            other_id = similarity_dict["record_id"]
-
-            # dedupe_operation.review_manager.logger.debug(
-            #     f"max_similarity ({max_similarity}): {batch_item['record']} {other_id}"
-            # )
-            # details = similarity_dict["details"]
-
-            # dedupe_operation.review_manager.logger.debug(details)
+            self.__log_similarity_details(
+                dedupe_operation=dedupe_operation,
+                records_list=records_list,
+                reference_index=reference_index,
+                similarity_dict=similarity_dict,
+            )
             msg = (
                 "Dropped duplicate: "
-                f'{similarity_dict["reference_record"]} (duplicate of {other_id})'
+                f"{reference_id} (duplicate of {other_id})"
                 # + f" (similarity: {max_similarity})\nDetails: {details}"
             )
             dedupe_operation.review_manager.report_logger.info(msg)
             dedupe_operation.review_manager.logger.info(msg)
             ret = {
-                "ID1": similarity_dict["reference_record"],
+                "ID1": reference_id,
                 "ID2": other_id,
                 "similarity": max_similarity,
                 "decision": "duplicate",
             }
         return ret
 
-    def __get_dedupe_data(self, *, dedupe_operation: colrev.ops.dedupe.Dedupe) -> dict:
-        records_headers = dedupe_operation.review_manager.dataset.load_records_dict(
-            header_only=True
-        )
-        record_header_list = list(records_headers.values())
+    def __get_dedupe_data(
+        self, *, dedupe_operation: colrev.ops.dedupe.Dedupe, records: dict
+    ) -> dict:
+        record_header_list = list(records.values())
 
         ids_to_dedupe = [
             x["ID"]
@@ -226,16 +403,18 @@ class SimpleDedupe(JsonSchemaMixin):
         return dedupe_data
 
     def __get_record_batch(
-        self, *, dedupe_operation: colrev.ops.dedupe.Dedupe, dedupe_data: dict
-    ) -> list:
-        records = dedupe_operation.review_manager.dataset.load_records_dict()
-
+        self,
+        *,
+        dedupe_operation: colrev.ops.dedupe.Dedupe,
+        dedupe_data: dict,
+        records: dict,
+    ) -> tuple:
         # Note: Because we only introduce individual (non-merged records),
         # there should be no semicolons in colrev_origin!
+        # Note: iterate over the queue (dict lookups instead of list-membership
+        # tests) to keep the records in the order of the queue
         records_queue = [
-            record
-            for ID, record in records.items()
-            if ID in dedupe_data["queue"]  # type: ignore
+            records[ID] for ID in dedupe_data["queue"] if ID in records  # type: ignore
         ]
 
         records_df_queue = pd.DataFrame.from_records(records_queue)
@@ -244,15 +423,18 @@ class SimpleDedupe(JsonSchemaMixin):
 
         items_start = dedupe_data["items_start"]
         items_start = 0
+        records_list = list(records.values())
+        # Note: batch items only refer to their position in the records_list
+        # (each record is compared to all prior records in the queue)
         batch_data = []
         for i in range(items_start, len(dedupe_data["queue"])):  # type: ignore
             batch_data.append(
                 {
                     "record": dedupe_data["queue"][i],  # type: ignore
-                    "queue": list(records.values())[: i + 1],
+                    "index": i,
                 }
             )
-        return batch_data
+        return records_list, batch_data
 
     def __process_potential_duplicates(
         self, *, dedupe_operation: colrev.ops.dedupe.Dedupe, dedupe_batch_results: list
@@ -261,14 +443,17 @@ class SimpleDedupe(JsonSchemaMixin):
             r for r in dedupe_batch_results if "potential_duplicate" == r["decision"]
         ]
 
+        if not potential_duplicates:
+            return potential_duplicates
+
         records = dedupe_operation.review_manager.dataset.load_records_dict()
         records = dedupe_operation.prep_records(
             records_df=pd.DataFrame.from_records(list(records.values()))
         )
         # dedupe.review_manager.p_printer.pprint(records.values())
-        records_df = pd.DataFrame(records.values())
 
-        keys = list(records_df.columns)
+        # Note: all prepared records have the same keys
+        keys = list(next(iter(records.values())).keys())
         for key_to_drop in [
             "ID",
             "colrev_origin",
@@ -281,10 +466,10 @@ class SimpleDedupe(JsonSchemaMixin):
 
         n_match, n_distinct = 0, 0
         for potential_duplicate in potential_duplicates:
-            rec1 = records_df.loc[records_df["ID"] == potential_duplicate["ID1"], :]
-            rec2 = records_df.loc[records_df["ID"] == potential_duplicate["ID2"], :]
-
-            record_pair = [rec1.to_dict("records")[0], rec2.to_dict("records")[0]]
+            record_pair = [
+                records[potential_duplicate["ID1"]],
+                records[potential_duplicate["ID2"]],
+            ]
 
             user_input = (
                 colrev.ops.built_in.dedupe.utils.console_duplicate_instance_label(
@@ -309,9 +494,6 @@ class SimpleDedupe(JsonSchemaMixin):
         models cannot be trained.
         """
 
-        # default='warn'
-        pd.options.mode.chained_assignment = None  # type: ignore  # noqa
-
         dedupe_operation.review_manager.logger.info(
             "Dedupe operation [colrev.simple_dedupe]"
         )
@@ -319,7 +501,12 @@ class SimpleDedupe(JsonSchemaMixin):
             "Duplicate identification based on static similarity measure and record pairs"
         )
 
-        dedupe_data = self.__get_dedupe_data(dedupe_operation=dedupe_operation)
+        # Note: the records are loaded once for the dedupe_data and the record batch
+        # (they are reloaded after the merges are applied)
+        records = dedupe_operation.review_manager.dataset.load_records_dict()
+        dedupe_data = self.__get_dedupe_data(
+            dedupe_operation=dedupe_operation, records=records
+        )
 
         # the queue (order) matters for the incremental merging (make sure that each
         # additional record is compared to/merged with all prior records in
@@ -329,14 +516,23 @@ class SimpleDedupe(JsonSchemaMixin):
             dedupe_operation.review_manager.logger.error("No records to dedupe")
             return
 
-        batch_data = self.__get_record_batch(
-            dedupe_operation=dedupe_operation, dedupe_data=dedupe_data
+        records_list, batch_data = self.__get_record_batch(
+            dedupe_operation=dedupe_operation, dedupe_data=dedupe_data, records=records
+        )
+
+        # Note: the similarities are computed once for all pairs in the queue
+        max_similarities, max_indices = self.__calculate_maximum_similarities(
+            records_list=records_list
         )
 
         dedupe_batch_results = []
         for item in batch_data:
             merge_item = self.__append_merges(
-                dedupe_operation=dedupe_operation, batch_item=item
+                dedupe_operation=dedupe_operation,
+                records_list=records_list,
+                batch_item=item,
+                max_similarities=max_similarities,
+                max_indices=max_indices,
             )
             dedupe_batch_results.append(merge_item)
 
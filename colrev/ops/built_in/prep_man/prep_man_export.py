@@ -133,12 +133,15 @@ class ExportManPrep(JsonSchemaMixin):
         }
 
         # Filter out fields that are not needed for manual preparation
-        filtered_man_prep_recs = {}
-        for citation, fields in man_prep_recs.copy().items():
-            for key in fields.copy():
-                if key not in self.__FIELDS_TO_KEEP:
-                    del fields[key]
-            filtered_man_prep_recs.update({citation: fields})
+        # Note : one pass (without copying and deleting from the records)
+        filtered_man_prep_recs = {
+            citation: {
+                key: value
+                for key, value in fields.items()
+                if key in self.__FIELDS_TO_KEEP
+            }
+            for citation, fields in man_prep_recs.items()
+        }
 
         self.review_manager.dataset.save_records_dict_to_file(
             records=filtered_man_prep_recs, save_path=self.prep_man_bib_path
@@ -1,15 +1,21 @@
 #! /usr/bin/env python
 """Curated metadata project"""
+from __future__ import annotations
+
 from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import zope.interface
 from dataclasses_jsonschema import JsonSchemaMixin
 
 import colrev.env.package_manager
 import colrev.env.utils
-import colrev.ops.search
-import colrev.record
+import colrev.ops.built_in.review_types.utils
+
+if TYPE_CHECKING:
+    import colrev.operation
+    import colrev.settings
 
 # pylint: disable=too-few-public-methods
 # pylint: disable=duplicate-code
@@ -28,7 +34,9 @@ class CuratedMasterdata(JsonSchemaMixin):
     def __init__(
         self, *, operation: colrev.operation.CheckOperation, settings: dict
     ) -> None:
-        self.settings = self.settings_class.load_settings(data=settings)
+        self.settings = colrev.ops.built_in.review_types.utils.load_settings(
+            settings_class=self.settings_class, settings=settings
+        )
         self.review_manager = operation.review_manager
 
     def __str__(self) -> str:
@@ -1,13 +1,19 @@
 #! /usr/bin/env python
 """Descriptive review"""
+from __future__ import annotations
+
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 import zope.interface
 from dataclasses_jsonschema import JsonSchemaMixin
 
 import colrev.env.package_manager
-import colrev.ops.search
-import colrev.record
+import colrev.ops.built_in.review_types.utils
+
+if TYPE_CHECKING:
+    import colrev.operation
+    import colrev.settings
 
 # pylint: disable=unused-argument
 # pylint: disable=duplicate-code
@@ -27,7 +33,9 @@ class DescriptiveReview(JsonSchemaMixin):
     def __init__(
         self, *, operation: colrev.operation.CheckOperation, settings: dict
     ) -> None:
-        self.settings = self.settings_class.load_settings(data=settings)
+        self.settings = colrev.ops.built_in.review_types.utils.load_settings(
+            settings_class=self.settings_class, settings=settings
+        )
 
     def __str__(self) -> str:
         return "descriptive review"
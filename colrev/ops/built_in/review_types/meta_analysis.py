@@ -1,19 +1,19 @@
 #! /usr/bin/env python
 """Meta-analysis"""
+from __future__ import annotations
+
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 import zope.interface
 from dataclasses_jsonschema import JsonSchemaMixin
 
 import colrev.env.package_manager
-import colrev.ops.search
-import colrev.record
-from colrev.ops.built_in.search_sources.open_citations_forward_search import (
-    OpenCitationsSearchSource,
-)
-from colrev.ops.built_in.search_sources.pdf_backward_search import (
-    BackwardSearchSource,
-)
+import colrev.ops.built_in.review_types.utils
+
+if TYPE_CHECKING:
+    import colrev.operation
+    import colrev.settings
 
 # pylint: disable=unused-argument
 # pylint: disable=duplicate-code
@@ -33,7 +33,9 @@ class MetaAnalysis(JsonSchemaMixin):
     def __init__(
         self, *, operation: colrev.operation.CheckOperation, settings: dict
     ) -> None:
-        self.settings = self.settings_class.load_settings(data=settings)
+        self.settings = colrev.ops.built_in.review_types.utils.load_settings(
+            settings_class=self.settings_class, settings=settings
+        )
 
     def __str__(self) -> str:
         return "meta-analysis"
@@ -43,6 +45,14 @@ class MetaAnalysis(JsonSchemaMixin):
     ) -> colrev.settings.Settings:
         """Initialize a meta-analysis"""
 
+        # pylint: disable=import-outside-toplevel
+        from colrev.ops.built_in.search_sources.open_citations_forward_search import (
+            OpenCitationsSearchSource,
+        )
+        from colrev.ops.built_in.search_sources.pdf_backward_search import (
+            BackwardSearchSource,
+        )
+
         settings.sources.append(OpenCitationsSearchSource.get_default_source())
         settings.sources.append(BackwardSearchSource.get_default_source())
 
@@ -0,0 +1,34 @@
+#! /usr/bin/env python
+"""Utility functions for review types"""
+from __future__ import annotations
+
+from copy import copy
+from functools import lru_cache
+
+import colrev.env.package_manager
+
+
+@lru_cache(maxsize=128)
+def _load_settings_cached(
+    settings_class: type, settings_items: tuple
+) -> colrev.env.package_manager.DefaultSettings:
+    return settings_class.load_settings(data=dict(settings_items))  # type: ignore
+
+
+def load_settings(
+    *, settings_class: type, settings: dict
+) -> colrev.env.package_manager.DefaultSettings:
+    """Load the settings of a review type (memoized)
+
+    Note: the settings are loaded once for identical settings dicts.
+    Each call returns a copy, i.e., modifying the settings of one review type
+    does not affect the (cached) settings of others. The values are hashable
+    (immutable), i.e., a shallow copy suffices.
+    """
+    try:
+        settings_items = tuple(sorted(settings.items()))
+        hash(settings_items)
+    except TypeError:
+        # Unhashable (or unsortable) settings values cannot be memoized
+        return settings_class.load_settings(data=settings)  # type: ignore
+    return copy(_load_settings_cached(settings_class, settings_items))
@@ -2,21 +2,26 @@
 """SearchSource: DBLP"""
 from __future__ import annotations
 
+import hashlib
 import html
 import json
 import re
 import typing
+from copy import deepcopy
 from dataclasses import dataclass
 from datetime import datetime
 from multiprocessing import Lock
+from multiprocessing.pool import ThreadPool as Pool
 from pathlib import Path
 from sqlite3 import OperationalError
 from typing import Optional
 
 import requests
+import requests_cache
 import zope.interface
 from dacite import from_dict
 from dataclasses_jsonschema import JsonSchemaMixin
+from requests.adapters import HTTPAdapter
 
 import colrev.env.package_manager
 import colrev.exceptions as colrev_exceptions
@@ -38,6 +43,34 @@ class DBLPSearchSource(JsonSchemaMixin):
     __api_url = "https://dblp.org/search/publ/api?q="
     __api_url_venues = "https://dblp.org/search/venue/api?q="
     __START_YEAR = 1980
+    __venue_suffix_regex = re.compile(r" \(.*?\)")
+    __whitespace_regex = re.compile(r"\s+")
+    __non_word_regex = re.compile(r"[\W]+")
+    __author_number_regex = re.compile(r"[0-9]{4}")
+    __braces_table = str.maketrans("", "", "{}")
+    # Note : {item type: (ENTRYTYPE, venue type, venue field)}
+    __item_types = {
+        "Journal Articles": ("article", "Journal", "journal"),
+        "Conference and Workshop Papers": (
+            "inproceedings",
+            "Conference or Workshop",
+            "booktitle",
+        ),
+    }
+    __withdrawn_warning = "Withdrawn (according to DBLP)"
+    # Note : {key prefix: item type} for withdrawn items
+    __withdrawn_item_types = {
+        "journals": "Journal Articles",
+        "conf": "Conference and Workshop Papers",
+    }
+    # Note : DBLP provides number-of-pages (instead of pages start-end)
+    __dropped_fields = frozenset(
+        ["venue", "type", "access", "key", "ee", "authors", "pages"]
+    )
+    # Note : transformations of fields that are mapped directly from the DBLP json
+    __field_transformations = {
+        "doi": str.upper,
+    }
 
     source_identifier = "dblp_key"
     search_type = colrev.settings.SearchType.DB
@@ -50,7 +83,14 @@ class DBLPSearchSource(JsonSchemaMixin):
         + "colrev/ops/built_in/search_sources/dblp.md"
     )
     __dblp_md_filename = Path("data/search/md_dblp.bib")
+    __page_digests_path = Path("data/search/.dblp_page_digests.json")
     __timeout: int = 10
+    __max_cached_queries = 10000
+    # Note : the venues are retrieved in parallel (the requests are I/O-bound)
+    __max_concurrent_requests = 8
+    # Note : the years of parameter searches (and the queries of md searches)
+    # are retrieved in parallel
+    __max_concurrent_queries = 4
 
     @dataclass
     class DBLPSearchSourceSettings(colrev.settings.SearchSource, JsonSchemaMixin):
@@ -104,11 +144,46 @@ class DBLPSearchSource(JsonSchemaMixin):
                     comment="",
                 )
         self.dblp_lock = Lock()
+        # Note : cache for the dblp_dicts retrieved for queries (e.g., titles in prep)
+        self.__query_cache: typing.Dict[str, list] = {}
+        # Note : cache for the venues ({(venue_string, venue_type): venue})
+        self.__venue_cache: typing.Dict[typing.Tuple[str, str], str] = {}
+        # Note : the md feed is loaded once (the prep threads share the object)
+        self.__md_feed: typing.Optional[colrev.ops.search.GeneralOriginFeed] = None
+        self.__session: typing.Optional[requests_cache.CachedSession] = None
+        # Note : digests of the (non-empty) pages of parameter searches ({url: digest})
+        self.__previous_page_digests: typing.Dict[str, str] = {}
+        self.__page_digests: typing.Dict[str, str] = {}
         self.origin_prefix = self.search_source.get_origin_prefix()
         self.review_manager = source_operation.review_manager
 
         _, self.email = source_operation.review_manager.get_committer()
 
+    def __get_md_feed(self) -> colrev.ops.search.GeneralOriginFeed:
+        """Get the md feed (loaded on first use, to be called with the dblp_lock)"""
+        if self.__md_feed is None:
+            self.__md_feed = self.search_source.get_feed(
+                review_manager=self.review_manager,
+                source_identifier=self.source_identifier,
+                update_only=False,
+            )
+        return self.__md_feed
+
+    def __get_session(self) -> requests_cache.CachedSession:
+        """Get the (cached) session, which is reused for all DBLP requests"""
+        # Note : reusing the session keeps connections alive
+        # (instead of a new connection and TLS handshake per request)
+        # Note : expired responses are revalidated by requests_cache
+        # (conditional requests based on ETag/Last-Modified, 304 without body)
+        if self.__session is None:
+            session = self.review_manager.get_cached_session()
+            pool_maxsize = (
+                self.__max_concurrent_queries * self.__max_concurrent_requests
+            )
+            session.mount("https://", HTTPAdapter(pool_maxsize=pool_maxsize))
+            self.__session = session
+        return self.__session
+
     def check_availability(
         self, *, source_operation: colrev.operation.Operation
     ) -> None:
@@ -157,56 +232,63 @@ class DBLPSearchSource(JsonSchemaMixin):
         # Note : journals that have been renamed seem to return the latest
         # journal name. Example:
         # https://dblp.org/db/journals/jasis/index.html
+        if (venue_string, venue_type) in self.__venue_cache:
+            return self.__venue_cache[(venue_string, venue_type)]
         venue = venue_string
         url = self.__api_url_venues + venue_string.replace(" ", "+") + "&format=json"
         headers = {"user-agent": f"{__name__} (mailto:{self.email})"}
         try:
             ret = session.request("GET", url, headers=headers, timeout=self.__timeout)
             ret.raise_for_status()
-            data = json.loads(ret.text)
+            # Note : decode the bytes (ret.text may detect the encoding first)
+            data = json.loads(ret.content)
             if "hit" not in data["result"]["hits"]:
-                return ""
-            hits = data["result"]["hits"]["hit"]
-            for hit in hits:
-                if hit["info"]["type"] != venue_type:
-                    continue
-                if f"/{venue_string.lower()}/" in hit["info"]["url"].lower():
-                    venue = hit["info"]["venue"]
-                    break
+                venue = ""
+            else:
+                hits = data["result"]["hits"]["hit"]
+                for hit in hits:
+                    if hit["info"]["type"] != venue_type:
+                        continue
+                    if f"/{venue_string.lower()}/" in hit["info"]["url"].lower():
+                        venue = hit["info"]["venue"]
+                        break
 
-            venue = re.sub(r" \(.*?\)", "", venue)
+                venue = self.__venue_suffix_regex.sub("", venue)
+            # Note : only venues retrieved successfully are cached
+            self.__venue_cache[(venue_string, venue_type)] = venue
         except requests.exceptions.RequestException:
             pass
         return venue
 
+    @classmethod
+    def __get_venue_query(
+        cls, *, item: dict
+    ) -> typing.Optional[typing.Tuple[str, str]]:
+        """Get the (venue_string, venue_type) for retrieving the venue of an item"""
+        if item["type"] not in cls.__item_types:
+            return None
+        lpos = item["key"].find("/") + 1
+        rpos = item["key"].rfind("/")
+        return item["key"][lpos:rpos], cls.__item_types[item["type"]][1]
+
     def __dblp_json_set_type(self, *, item: dict, session: requests.Session) -> None:
         if item["type"] == "Withdrawn Items":
-            if item["key"][:8] == "journals":
-                item["type"] = "Journal Articles"
-            if item["key"][:4] == "conf":
-                item["type"] = "Conference and Workshop Papers"
-            item["warning"] = "Withdrawn (according to DBLP)"
-
-        if item["type"] == "Journal Articles":
-            item["ENTRYTYPE"] = "article"
-            lpos = item["key"].find("/") + 1
-            rpos = item["key"].rfind("/")
-            ven_key = item["key"][lpos:rpos]
-            item["journal"] = self.__get_dblp_venue(
-                session=session,
-                venue_string=ven_key,
-                venue_type="Journal",
-            )
-        elif item["type"] == "Conference and Workshop Papers":
-            item["ENTRYTYPE"] = "inproceedings"
-            lpos = item["key"].find("/") + 1
-            rpos = item["key"].rfind("/")
-            ven_key = item["key"][lpos:rpos]
-            item["booktitle"] = self.__get_dblp_venue(
-                session=session,
-                venue_string=ven_key,
-                venue_type="Conference or Workshop",
+            item["type"] = self.__withdrawn_item_types.get(
+                item["key"].split("/", 1)[0], item["type"]
             )
+            item["warning"] = self.__withdrawn_warning
+
+        venue_query = self.__get_venue_query(item=item)
+        if venue_query is None:
+            return
+        venue_string, venue_type = venue_query
+        entrytype, _, venue_field = self.__item_types[item["type"]]
+        item["ENTRYTYPE"] = entrytype
+        item[venue_field] = self.__get_dblp_venue(
+            session=session,
+            venue_string=venue_string,
+            venue_type=venue_type,
+        )
 
     def __dblp_json_to_dict(
         self,
@@ -220,9 +302,9 @@ class DBLPSearchSource(JsonSchemaMixin):
         self.__dblp_json_set_type(item=item, session=session)
         if "title" in item:
             item["title"] = item["title"].rstrip(".").rstrip().replace("\n", " ")
-            item["title"] = re.sub(r"\s+", " ", item["title"])
-        if "pages" in item:
-            item["pages"] = item["pages"].replace("-", "--")
+            item["title"] = self.__whitespace_regex.sub(" ", item["title"])
+        for key in self.__field_transformations.keys() & item.keys():
+            item[key] = self.__field_transformations[key](item[key])
         if "authors" in item:
             if "author" in item["authors"]:
                 if isinstance(item["authors"]["author"], dict):
@@ -243,29 +325,95 @@ class DBLPSearchSource(JsonSchemaMixin):
         if "key" in item:
             item["dblp_key"] = "https://dblp.org/rec/" + item["key"]
 
-        if "doi" in item:
-            item["doi"] = item["doi"].upper()
         if "ee" in item:
             if not any(
                 x in item["ee"] for x in ["https://doi.org", "https://dblp.org"]
             ):
                 item["url"] = item["ee"]
 
-        item = {
-            k: v
+        # Note : fields are dropped and values cleaned in a single pass
+        return {
+            k: html.unescape(v).translate(self.__braces_table)
             for k, v in item.items()
-            if k not in ["venue", "type", "access", "key", "ee", "authors"]
+            if k not in self.__dropped_fields
         }
-        for key, value in item.items():
-            item[key] = html.unescape(value).replace("{", "").replace("}", "")
 
-        return item
+    def __get_dblp_page(self, *, session: requests.Session, url: str) -> dict:
+        """Get the (decoded) page returned by DBLP"""
+        headers = {"user-agent": f"{__name__}  (mailto:{self.email})"}
+        # review_manager.logger.debug(url)
+        ret = session.request("GET", url, headers=headers, timeout=self.__timeout)
+        ret.raise_for_status()
+        if ret.status_code == 500:
+            return {}
+
+        # Note : decode the bytes (ret.text may detect the encoding first)
+        return json.loads(ret.content)
+
+    @classmethod
+    def __get_dblp_items_from_page(cls, *, page: dict) -> list:
+        """Get the items (info of the hits) of a DBLP page"""
+        hits = page.get("result", {}).get("hits", {})
+        return [hit["info"] for hit in hits.get("hit", [])]
+
+    def __get_dblp_items(self, *, session: requests.Session, url: str) -> list:
+        """Get the items (info of the hits) returned by DBLP"""
+        # Note : only the items are returned. The response and the remaining
+        # json (e.g., scores, urls) are released before the items are converted.
+        return self.__get_dblp_items_from_page(
+            page=self.__get_dblp_page(session=session, url=url)
+        )
+
+    @classmethod
+    def get_page_digest(cls, *, page: dict) -> str:
+        """Get the digest of a DBLP page (based on the total and the hits' info)"""
+        # Note : per-request fields (e.g., result.time, result.status)
+        # and the scores of the hits are not part of the digest
+        stable_payload = {
+            "total": page.get("result", {}).get("hits", {}).get("@total", ""),
+            "items": cls.__get_dblp_items_from_page(page=page),
+        }
+        return hashlib.blake2b(
+            json.dumps(stable_payload, sort_keys=True).encode("utf-8"),
+            digest_size=16,
+        ).hexdigest()
+
+    def __get_dblp_dicts(
+        self, *, url: str, items: typing.Optional[list] = None
+    ) -> list:
+        session = self.__get_session()
+        if items is None:
+            items = self.__get_dblp_items(session=session, url=url)
+
+        # Note : items typically share few venues (e.g., in venue/year searches).
+        # Each distinct venue is retrieved once (before converting the items)
+        venue_queries = {
+            venue_query
+            for venue_query in (self.__get_venue_query(item=item) for item in items)
+            if venue_query is not None and venue_query not in self.__venue_cache
+        }
+
+        def get_venue(venue_query: typing.Tuple[str, str]) -> str:
+            return self.__get_dblp_venue(
+                session=session,
+                venue_string=venue_query[0],
+                venue_type=venue_query[1],
+            )
+
+        # Note : the pool is only created if several venues are retrieved
+        if len(venue_queries) > 1:
+            with Pool(min(len(venue_queries), self.__max_concurrent_requests)) as pool:
+                pool.map(get_venue, venue_queries)
+
+        # Note : the conversion is CPU-bound (the venues are cached at this point)
+        return [self.__dblp_json_to_dict(session=session, item=item) for item in items]
 
     def __retrieve_dblp_records(
         self,
         *,
         query: Optional[str] = None,
         url: Optional[str] = None,
+        items: Optional[list] = None,
     ) -> list:
         """Retrieve records from DBLP based on a query"""
 
@@ -273,46 +421,29 @@ class DBLPSearchSource(JsonSchemaMixin):
 
         try:
             assert query is not None or url is not None
-            session = self.review_manager.get_cached_session()
-            items = []
 
             if query:
-                query = re.sub(r"[\W]+", " ", query.replace(" ", "_"))
+                query = self.__non_word_regex.sub(" ", query.replace(" ", "_"))
                 url = self.__api_url + query.replace(" ", "+") + "&format=json"
 
-            headers = {"user-agent": f"{__name__}  (mailto:{self.email})"}
-            # review_manager.logger.debug(url)
-            ret = session.request(
-                "GET", url, headers=headers, timeout=self.__timeout  # type: ignore
-            )
-            ret.raise_for_status()
-            if ret.status_code == 500:
-                return []
-
-            data = json.loads(ret.text)
-            if "hits" not in data["result"]:
-                return []
-            if "hit" not in data["result"]["hits"]:
-                return []
-            hits = data["result"]["hits"]["hit"]
-            items = [hit["info"] for hit in hits]
-            dblp_dicts = [
-                self.__dblp_json_to_dict(
-                    session=session,
-                    item=item,
-                )
-                for item in items
-            ]
-            retrieved_records = [
-                colrev.record.PrepRecord(data=dblp_dict) for dblp_dict in dblp_dicts
-            ]
-            for retrieved_record in retrieved_records:
-                # Note : DBLP provides number-of-pages (instead of pages start-end)
-                if "pages" in retrieved_record.data:
-                    del retrieved_record.data["pages"]
-                retrieved_record.add_provenance_all(
-                    source=retrieved_record.data["dblp_key"]
-                )
+            # Note : records are often prepared with the same (title) query
+            # (e.g., duplicates). Cached dblp_dicts are copied because the
+            # retrieved records are modified by the callers.
+            if query and url in self.__query_cache:
+                dblp_dicts = deepcopy(self.__query_cache[url])
+            else:
+                dblp_dicts = self.__get_dblp_dicts(url=url, items=items)  # type: ignore
+                if query:
+                    if len(self.__query_cache) >= self.__max_cached_queries:
+                        self.__query_cache.clear()
+                    self.__query_cache[url] = deepcopy(dblp_dicts)  # type: ignore
+
+            retrieved_records = []
+            for dblp_dict in dblp_dicts:
+                # Note : the records share the dicts (they are not copied)
+                retrieved_record = colrev.record.PrepRecord(data=dblp_dict)
+                retrieved_record.add_provenance_all(source=dblp_dict["dblp_key"])
+                retrieved_records.append(retrieved_record)
 
         # pylint: disable=duplicate-code
         except OperationalError as exc:
@@ -370,6 +501,19 @@ class DBLPSearchSource(JsonSchemaMixin):
     ) -> None:
         records = search_operation.review_manager.dataset.load_records_dict()
 
+        # Note : each distinct (title) query is retrieved once and in parallel.
+        # The loop below reads the retrieved records from the query cache.
+        queries = {
+            feed_record_dict.get("title", "").replace("-", "_")
+            for feed_record_dict in dblp_feed.feed_records.values()
+        }
+        queries.discard("")
+        if queries:
+            with Pool(min(len(queries), self.__max_concurrent_queries)) as pool:
+                pool.map(
+                    lambda query: self.__retrieve_dblp_records(query=query), queries
+                )
+
         for feed_record_dict in dblp_feed.feed_records.values():
             feed_record = colrev.record.Record(data=feed_record_dict)
             query = "" + feed_record.data.get("title", "").replace("-", "_")
@@ -406,74 +550,135 @@ class DBLPSearchSource(JsonSchemaMixin):
         search_operation.review_manager.dataset.save_records_dict(records=records)
         search_operation.review_manager.dataset.add_record_changes()
 
-    def __run_param_search_year_batch(
-        self,
-        *,
-        query: str,
-        search_operation: colrev.ops.search.Search,
-        dblp_feed: colrev.ops.search.GeneralOriginFeed,
-        records: dict,
-        rerun: bool,
-    ) -> None:
+    def __retrieve_year_batch(self, query: str) -> list:
+        """Retrieve the records of a year (all pages)"""
+        session = self.__get_session()
+        retrieved_records = []
         batch_size_cumulative = 0
         batch_size = 250
+        query = query.replace(" ", "+")
         while True:
-            url = (
-                query.replace(" ", "+")
-                + f"&format=json&h={batch_size}&f={batch_size_cumulative}"
-            )
+            url = f"{query}&format=json&h={batch_size}&f={batch_size_cumulative}"
             batch_size_cumulative += batch_size
 
-            retrieved = False
-            for retrieved_record in self.__retrieve_dblp_records(url=url):
-                retrieved = True
+            try:
+                page = self.__get_dblp_page(session=session, url=url)
+            except (
+                requests.exceptions.ReadTimeout,
+                requests.exceptions.HTTPError,
+            ) as exc:
+                raise colrev_exceptions.ServiceNotAvailableException(
+                    "requests timed out "
+                    "(possibly because the DBLP service is temporarily not available)"
+                ) from exc
+            items = self.__get_dblp_items_from_page(page=page)
+            if not items:
+                break
 
-                if (
-                    "scope" in self.search_source.search_parameters
-                    and (
-                        f"{self.search_source.search_parameters['scope']['venue_key']}/"
-                        not in retrieved_record.data["dblp_key"]
-                    )
-                ) or retrieved_record.data.get("ENTRYTYPE", "") not in [
-                    "article",
-                    "inproceedings",
-                ]:
-                    continue
+            # Note : the page is decoded once (for the digest and the conversion)
+            digest = self.get_page_digest(page=page)
+            self.__page_digests[url] = digest
+            if self.__previous_page_digests.get(url, "") == digest:
+                # Note : pages that are unchanged since the last run are not converted
+                self.review_manager.logger.debug(f"Skip unchanged page {url}")
+                continue
 
-                try:
-                    dblp_feed.set_id(record_dict=retrieved_record.data)
-                except colrev_exceptions.NotFeedIdentifiableException:
-                    continue
-
-                prev_record_dict_version = {}
-                if retrieved_record.data["ID"] in dblp_feed.feed_records:
-                    prev_record_dict_version = dblp_feed.feed_records[
-                        retrieved_record.data["ID"]
-                    ]
+            retrieved_records.extend(self.__retrieve_dblp_records(url=url, items=items))
+        return retrieved_records
 
-                added = dblp_feed.add_record(
-                    record=retrieved_record,
-                )
+    def __get_feed_digest(
+        self, *, dblp_feed: colrev.ops.search.GeneralOriginFeed
+    ) -> str:
+        """Get the digest of the feed file (content)"""
+        feed_file = self.review_manager.path / dblp_feed.feed_file
+        if not feed_file.is_file():
+            return ""
+        return hashlib.blake2b(feed_file.read_bytes(), digest_size=16).hexdigest()
+
+    def __read_page_digests_file(self) -> dict:
+        page_digests_path = self.review_manager.path / self.__page_digests_path
+        if not page_digests_path.is_file():
+            return {}
+        with open(page_digests_path, encoding="utf8") as file:
+            return json.load(file)
+
+    def __load_page_digests(
+        self, *, dblp_feed: colrev.ops.search.GeneralOriginFeed
+    ) -> typing.Dict[str, str]:
+        """Load the page digests of the last run of the search source"""
+        page_digests = self.__read_page_digests_file().get(
+            str(self.search_source.filename), {}
+        )
+        # Note : the digests are only used if the feed file was not changed
+        # since the last run (e.g., records edited, removed or added)
+        if page_digests.get("feed_digest", "") != self.__get_feed_digest(
+            dblp_feed=dblp_feed
+        ):
+            return {}
+        return page_digests.get("digests", {})
 
-                if added:
-                    self.review_manager.logger.info(
-                        " retrieve " + retrieved_record.data["dblp_key"]
-                    )
-                    dblp_feed.nr_added += 1
+    def __save_page_digests(
+        self, *, dblp_feed: colrev.ops.search.GeneralOriginFeed
+    ) -> None:
+        page_digests = self.__read_page_digests_file()
+        source_page_digests = {
+            "feed_digest": self.__get_feed_digest(dblp_feed=dblp_feed),
+            "digests": self.__page_digests,
+        }
+        # Note : the file (and the .gitignore) are only written if the digests changed
+        if (
+            page_digests.get(str(self.search_source.filename), {})
+            == source_page_digests
+        ):
+            return
+        page_digests[str(self.search_source.filename)] = source_page_digests
+        page_digests_path = self.review_manager.path / self.__page_digests_path
+        page_digests_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(page_digests_path, "w", encoding="utf8") as file:
+            json.dump(page_digests, file, indent=4, sort_keys=True)
+        self.review_manager.dataset.update_gitignore(add=[self.__page_digests_path])
 
-                else:
-                    changed = search_operation.update_existing_record(
-                        records=records,
-                        record_dict=retrieved_record.data,
-                        prev_record_dict_version=prev_record_dict_version,
-                        source=self.search_source,
-                        update_time_variant_fields=rerun,
-                    )
-                    if changed:
-                        dblp_feed.nr_changed += 1
+    def __run_param_search_year_batch(
+        self,
+        *,
+        retrieved_records: list,
+        search_operation: colrev.ops.search.Search,
+        dblp_feed: colrev.ops.search.GeneralOriginFeed,
+        records: dict,
+        rerun: bool,
+    ) -> None:
+        # Note : the scope is determined once (not for every retrieved record)
+        venue_key = ""
+        if "scope" in self.search_source.search_parameters:
+            venue_key = f"{self.search_source.search_parameters['scope']['venue_key']}/"
+        retrieved_records = [
+            retrieved_record
+            for retrieved_record in retrieved_records
+            if (not venue_key or venue_key in retrieved_record.data["dblp_key"])
+            and retrieved_record.data.get("ENTRYTYPE", "")
+            in ("article", "inproceedings")
+        ]
+
+        # Note : the records of a year are added to the feed in one batch
+        for retrieved_record, added, prev_record_dict_version in dblp_feed.add_records(
+            records=retrieved_records
+        ):
+            if added:
+                self.review_manager.logger.info(
+                    " retrieve " + retrieved_record.data["dblp_key"]
+                )
+                dblp_feed.nr_added += 1
 
-            if not retrieved:
-                break
+            else:
+                changed = search_operation.update_existing_record(
+                    records=records,
+                    record_dict=retrieved_record.data,
+                    prev_record_dict_version=prev_record_dict_version,
+                    source=self.search_source,
+                    update_time_variant_fields=rerun,
+                )
+                if changed:
+                    dblp_feed.nr_changed += 1
 
         dblp_feed.save_feed_file()
         self.review_manager.dataset.save_records_dict(records=records)
@@ -506,16 +711,33 @@ class DBLPSearchSource(JsonSchemaMixin):
             if len(dblp_feed.feed_records) > 100 and not rerun:
                 start = datetime.now().year - 2
 
-            for year in range(start, datetime.now().year + 1):
-                self.review_manager.logger.debug(f"Retrieve year {year}")
-                self.__run_param_search_year_batch(
-                    query=self.__get_query(year=year),
-                    search_operation=search_operation,
-                    dblp_feed=dblp_feed,
-                    records=records,
-                    rerun=rerun,
+            # Note : unchanged pages are skipped,
+            # unless the search is rerun (or in force mode)
+            self.__previous_page_digests = {}
+            if not rerun and not search_operation.review_manager.force_mode:
+                self.__previous_page_digests = self.__load_page_digests(
+                    dblp_feed=dblp_feed
                 )
+            self.__page_digests = {}
+
+            years = list(range(start, datetime.now().year + 1))
+            queries = [self.__get_query(year=year) for year in years]
+            # Note : the years are retrieved in parallel (the requests are I/O-bound).
+            # The feed and records are updated in the main thread (in order of years)
+            with Pool(min(len(years), self.__max_concurrent_queries)) as pool:
+                for year, retrieved_records in zip(
+                    years, pool.imap(self.__retrieve_year_batch, queries)
+                ):
+                    self.review_manager.logger.debug(f"Retrieve year {year}")
+                    self.__run_param_search_year_batch(
+                        retrieved_records=retrieved_records,
+                        search_operation=search_operation,
+                        dblp_feed=dblp_feed,
+                        records=records,
+                        rerun=rerun,
+                    )
 
+            self.__save_page_digests(dblp_feed=dblp_feed)
             dblp_feed.print_post_run_search_infos(records=records)
 
         except (requests.exceptions.RequestException,):
@@ -615,7 +837,7 @@ class DBLPSearchSource(JsonSchemaMixin):
             # DBLP appends identifiers to non-unique authors
             record.update_field(
                 key="author",
-                value=str(re.sub(r"[0-9]{4}", "", record.data["author"])),
+                value=str(self.__author_number_regex.sub("", record.data["author"])),
                 source="dblp",
                 keep_source_if_equal=True,
             )
@@ -663,14 +885,7 @@ class DBLPSearchSource(JsonSchemaMixin):
                     try:
                         self.dblp_lock.acquire(timeout=60)
 
-                        # Note : need to reload file
-                        # because the object is not shared between processes
-                        dblp_feed = self.search_source.get_feed(
-                            review_manager=prep_operation.review_manager,
-                            source_identifier=self.source_identifier,
-                            update_only=False,
-                        )
-
+                        dblp_feed = self.__get_md_feed()
                         dblp_feed.set_id(record_dict=retrieved_record.data)
                         dblp_feed.add_record(record=retrieved_record)
 
@@ -678,30 +893,36 @@ class DBLPSearchSource(JsonSchemaMixin):
                             merging_record=retrieved_record,
                             default_source=retrieved_record.data["colrev_origin"][0],
                         )
-                        record.set_masterdata_complete(
-                            source=retrieved_record.data["colrev_origin"][0],
-                            masterdata_repository=self.review_manager.settings.is_curated_repo(),
-                        )
-                        record.set_status(
-                            target_state=colrev.record.RecordState.md_prepared
-                        )
-                        if "Withdrawn (according to DBLP)" in record.data.get(
-                            "warning", ""
-                        ):
-                            record.prescreen_exclude(reason="retracted")
-                            record.remove_field(key="warning")
-
                         dblp_feed.save_feed_file()
                         self.dblp_lock.release()
-                        return record
 
-                    except (
-                        colrev_exceptions.InvalidMerge,
-                        colrev_exceptions.NotFeedIdentifiableException,
-                    ):
+                    except colrev_exceptions.InvalidMerge:
+                        # Note : the record added to the feed is discarded
+                        # (by reloading the feed from the last saved version)
+                        self.__md_feed = None
+                        self.dblp_lock.release()
+                        continue
+                    except colrev_exceptions.NotFeedIdentifiableException:
                         self.dblp_lock.release()
                         continue
 
+                    record.set_masterdata_complete(
+                        source=retrieved_record.data["colrev_origin"][0],
+                        masterdata_repository=self.review_manager.settings.is_curated_repo(),
+                    )
+                    record.set_status(
+                        target_state=colrev.record.RecordState.md_prepared
+                    )
+                    # Note : the retrieved record carries the warning set by
+                    # __dblp_json_set_type (exact match instead of a substring test)
+                    if (
+                        retrieved_record.data.get("warning", "")
+                        == self.__withdrawn_warning
+                    ):
+                        record.prescreen_exclude(reason="retracted")
+                        record.remove_field(key="warning")
+                    return record
+
         except requests.exceptions.RequestException:
             pass
 
@@ -40,6 +40,8 @@ class IEEEXploreSearchSource(JsonSchemaMixin):
         "https://github.com/CoLRev-Environment/colrev/blob/main/"
         + "colrev/ops/built_in/search_sources/ieee.md"
     )
+    __bib_entry_regex = re.compile(r"@[A-Z]*\{[0-9]*,\n")
+    __title_fix_types = frozenset(("CONF", "JOUR"))
 
     def __init__(
         self, *, source_operation: colrev.operation.Operation, settings: dict
@@ -81,13 +83,15 @@ class IEEEXploreSearchSource(JsonSchemaMixin):
 
         result = {"confidence": 0.1}
 
+        # Note : only the first line is needed (instead of splitting all lines)
+        first_line = data.partition("\n")[0]
+        if "Date Added To Xplore" in first_line and "IEEE Terms" in first_line:
+            result["confidence"] = 1.0
+            return result
+
         if "INPROCEEDINGS" in data:
-            if len(re.findall(r"@[A-Z]*\{[0-9]*,\n", data)) >= data.count("\n@"):
+            if len(cls.__bib_entry_regex.findall(data)) >= data.count("\n@"):
                 result["confidence"] = 1.0
-        if all(
-            x in data.splitlines()[0] for x in ["Date Added To Xplore", "IEEE Terms"]
-        ):
-            result["confidence"] = 1.0
 
         return result
 
@@ -115,11 +119,17 @@ class IEEEXploreSearchSource(JsonSchemaMixin):
 
     def __ris_fixes(self, *, entries: dict) -> None:
         for entry in entries:
-            if entry["type_of_reference"] in ["CONF", "JOUR"]:
-                if "title" in entry and "primary_title" not in entry:
-                    entry["primary_title"] = entry.pop("title")
-            if "publication_year" in entry and "year" not in entry:
-                entry["year"] = entry.pop("publication_year")
+            if (
+                entry["type_of_reference"] in self.__title_fix_types
+                and "primary_title" not in entry
+            ):
+                title = entry.pop("title", None)
+                if title is not None:
+                    entry["primary_title"] = title
+            if "year" not in entry:
+                year = entry.pop("publication_year", None)
+                if year is not None:
+                    entry["year"] = year
 
     def load(self, *, load_operation: colrev.ops.load.Load) -> dict:
         """Load the records from the SearchSource file"""
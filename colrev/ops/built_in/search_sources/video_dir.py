@@ -2,6 +2,8 @@
 """SearchSource: directory containing video files"""
 from __future__ import annotations
 
+import itertools
+import os
 import typing
 from dataclasses import dataclass
 from multiprocessing import Lock
@@ -42,6 +44,7 @@ class VideoDirSearchSource(JsonSchemaMixin):
         "https://github.com/CoLRev-Environment/colrev/blob/main/"
         + "colrev/ops/built_in/search_sources/video_dir.md"
     )
+    __feed_chunk_size = 1000
 
     def __init__(
         self, *, source_operation: colrev.operation.Operation, settings: dict
@@ -83,6 +86,21 @@ class VideoDirSearchSource(JsonSchemaMixin):
             f"SearchSource {source.filename} validated"
         )
 
+    def __get_video_files(self) -> typing.Iterator[Path]:
+        """Get the video files (recursively) in the video_path"""
+        # Note : os.scandir provides the file types from the directory listing
+        # (instead of a stat call per file)
+        if not self.video_path.is_dir():
+            return
+        directories = [self.video_path]
+        while directories:
+            with os.scandir(directories.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        directories.append(Path(entry.path))
+                    elif entry.name.endswith(".mp4"):
+                        yield Path(entry.path)
+
     def __index_video(self, *, path: Path) -> dict:
         record_dict = {"ENTRYTYPE": "online", "file": path}
         return record_dict
@@ -103,25 +121,26 @@ class VideoDirSearchSource(JsonSchemaMixin):
             update_only=(not rerun),
         )
 
-        overall_files = [
+        # Note : the files are indexed while the directory is scanned
+        overall_files = (
             x.relative_to(search_operation.review_manager.path)
-            for x in self.video_path.glob("**/*.mp4")
-        ]
+            for x in self.__get_video_files()
+        )
 
+        # Note : the records are indexed and added in chunks
+        # (to bound the number of pending records that are kept in memory)
         new_records_added = 0
-        for file_to_add in overall_files:
-            new_record = self.__index_video(path=file_to_add)
-
-            try:
-                video_feed.set_id(record_dict=new_record)
-            except colrev_exceptions.NotFeedIdentifiableException:
-                continue
-
-            added = video_feed.add_record(
-                record=colrev.record.Record(data=new_record),
-            )
-            if added:
-                new_records_added += 1
+        while True:
+            chunk = [
+                colrev.record.Record(data=self.__index_video(path=file_to_add))
+                for file_to_add in itertools.islice(
+                    overall_files, self.__feed_chunk_size
+                )
+            ]
+            if not chunk:
+                break
+            added_records = video_feed.add_records(records=chunk)
+            new_records_added += sum(added_new for _, added_new, _ in added_records)
 
         video_feed.save_feed_file()
 
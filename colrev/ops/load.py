@@ -789,8 +789,10 @@ class Load(colrev.operation.Operation):
         )
 
         imported_origins = self.__get_currently_imported_origin_list()
+        # Note : set-membership (instead of scanning the list for each record)
+        imported_origins_set = set(imported_origins)
         record_list = [
-            x for x in record_list if x["colrev_origin"][0] not in imported_origins
+            x for x in record_list if x["colrev_origin"][0] not in imported_origins_set
         ]
         source.setup_for_load(
             record_list=record_list, imported_origins=imported_origins
@@ -2,21 +2,66 @@
 """CoLRev pdf_prep_man operation: Prepare PDF documents manually."""
 from __future__ import annotations
 
+import logging
+import multiprocessing as mp
+import os
+import typing
 from pathlib import Path
-
-import pandas as pd
-from PyPDF2 import PdfFileReader
-from PyPDF2 import PdfFileWriter
-from PyPDF2.errors import PdfReadError
+from typing import TYPE_CHECKING
 
 import colrev.exceptions as colrev_exceptions
 import colrev.operation
 import colrev.record
 
+if TYPE_CHECKING:
+    from PyPDF2 import PdfFileWriter
+
+# pylint: disable=import-outside-toplevel
+# Note : PyPDF2 and pandas are imported lazily (they are slow to import)
+
+# Note : PyPDF2 emits many small writes (hence the large buffer)
+PDF_WRITE_BUFFER_SIZE = 1 << 20
+
+
+def write_pdf(*, writer: PdfFileWriter, filepath: Path) -> None:
+    """Write a PDF (replacing the filepath only once the PDF is written completely)"""
+
+    tmp_filepath = filepath.with_name(filepath.name + ".tmp")
+    try:
+        with open(tmp_filepath, "wb", buffering=PDF_WRITE_BUFFER_SIZE) as outfile:
+            writer.write(outfile)
+        os.replace(tmp_filepath, filepath)
+    finally:
+        tmp_filepath.unlink(missing_ok=True)
+
+
+# Note : module-level function (pickle-ability in multiprocessing)
+def extract_coverpage_to_path(filepath: Path, cp_path: Path) -> None:
+    """Extract the coverpage from a PDF and save it in the cp_path"""
+    from PyPDF2 import PdfFileReader
+    from PyPDF2 import PdfFileWriter
+    from PyPDF2.errors import PdfReadError
+
+    try:
+        pdf_reader = PdfFileReader(str(filepath), strict=False)
+        writer_cp = PdfFileWriter()
+        writer_cp.addPage(pdf_reader.pages[0])
+        writer = PdfFileWriter()
+        # Note : the pages are parsed lazily (when they are added)
+        for page in pdf_reader.pages[1:]:
+            writer.addPage(page)
+        write_pdf(writer=writer, filepath=filepath)
+        write_pdf(writer=writer_cp, filepath=cp_path / filepath.name)
+    except PdfReadError as exc:
+        raise colrev_exceptions.InvalidPDFException(filepath) from exc
+
 
 class PDFPrepMan(colrev.operation.Operation):
     """Prepare PDFs manually"""
 
+    PREP_BIB_FILE_RELATIVE = Path("data/pdf-prep-records.bib")
+    PREP_CSV_FILE_RELATIVE = Path("data/pdf-prep-records.csv")
+
     def __init__(
         self,
         *,
@@ -57,30 +102,27 @@ class PDFPrepMan(colrev.operation.Operation):
         records_headers = self.review_manager.dataset.load_records_dict(
             header_only=True
         )
-        record_header_list = list(records_headers.values())
-        nr_tasks = len(
-            [
-                x
-                for x in record_header_list
-                if colrev.record.RecordState.pdf_needs_manual_preparation
-                == x["colrev_status"]
-            ]
+        needs_manual_preparation = (
+            colrev.record.RecordState.pdf_needs_manual_preparation
         )
+        # Note : the tasks and the maximum ID length are determined in one pass
+        nr_tasks, max_id_len = 0, 0
+        for record_header in records_headers.values():
+            if record_header["colrev_status"] == needs_manual_preparation:
+                nr_tasks += 1
+            max_id_len = max(max_id_len, len(record_header["ID"]))
         pad = 0
-        if record_header_list:
-            pad = min((max(len(x["ID"]) for x in record_header_list) + 2), 40)
+        if records_headers:
+            pad = min(max_id_len + 2, 40)
 
         items = self.review_manager.dataset.read_next_record(
-            conditions=[
-                {
-                    "colrev_status": colrev.record.RecordState.pdf_needs_manual_preparation
-                }
-            ]
+            conditions=[{"colrev_status": needs_manual_preparation}]
         )
         pdf_prep_man_data = {"nr_tasks": nr_tasks, "PAD": pad, "items": items}
-        self.review_manager.logger.debug(
-            self.review_manager.p_printer.pformat(pdf_prep_man_data)
-        )
+        if self.review_manager.logger.isEnabledFor(logging.DEBUG):
+            self.review_manager.logger.debug(
+                self.review_manager.p_printer.pformat(pdf_prep_man_data)
+            )
         return pdf_prep_man_data
 
     def pdfs_prepared_manually(self) -> bool:
@@ -89,6 +131,8 @@ class PDFPrepMan(colrev.operation.Operation):
 
     def pdf_prep_man_stats(self) -> None:
         """Determine PDF prep man statistics"""
+        import pandas as pd
+
         # pylint: disable=duplicate-code
 
         self.review_manager.logger.info(
@@ -97,48 +141,37 @@ class PDFPrepMan(colrev.operation.Operation):
         records = self.review_manager.dataset.load_records_dict()
 
         self.review_manager.logger.info("Calculate statistics")
-        stats: dict = {"ENTRYTYPE": {}}
 
-        prep_man_hints = []
-        crosstab = []
+        # Note : (journal, note) per record (the hints are split in pandas)
+        journal_notes = []
+        needs_manual_preparation = (
+            colrev.record.RecordState.pdf_needs_manual_preparation
+        )
         for record_dict in records.values():
-            if (
-                colrev.record.RecordState.pdf_needs_manual_preparation
-                != record_dict["colrev_status"]
-            ):
+            if record_dict["colrev_status"] != needs_manual_preparation:
                 continue
 
-            if record_dict["ENTRYTYPE"] in stats["ENTRYTYPE"]:
-                stats["ENTRYTYPE"][record_dict["ENTRYTYPE"]] = (
-                    stats["ENTRYTYPE"][record_dict["ENTRYTYPE"]] + 1
-                )
-            else:
-                stats["ENTRYTYPE"][record_dict["ENTRYTYPE"]] = 1
-
             record = colrev.record.Record(data=record_dict)
             prov_d = record.data["colrev_data_provenance"]
 
             if "file" in prov_d:
                 if prov_d["file"]["note"] != "":
-                    for hint in prov_d["file"]["note"].split(","):
-                        prep_man_hints.append(hint.lstrip())
-
-            for hint in prep_man_hints:
-                crosstab.append([record_dict["journal"], hint.lstrip()])
+                    journal_notes.append(
+                        (record_dict["journal"], prov_d["file"]["note"])
+                    )
 
-        crosstab_df = pd.DataFrame(crosstab, columns=["journal", "hint"])
+        # Note : the hints are counted for the record they refer to
+        crosstab_df = pd.DataFrame(journal_notes, columns=["journal", "note"])
+        crosstab_df["hint"] = crosstab_df["note"].str.split(",")
+        crosstab_df = crosstab_df.explode("hint")
+        crosstab_df["hint"] = crosstab_df["hint"].str.lstrip()
 
         if crosstab_df.empty:
             print("No records to prepare manually.")
         else:
             # pylint: disable=duplicate-code
-            tabulated = pd.pivot_table(
-                crosstab_df[["journal", "hint"]],
-                index=["journal"],
-                columns=["hint"],
-                aggfunc=len,
-                fill_value=0,
-                margins=True,
+            tabulated = pd.crosstab(
+                crosstab_df["journal"], crosstab_df["hint"], margins=True
             )
             # .sort_index(axis='columns')
             tabulated.sort_values(by=["All"], ascending=False, inplace=True)
@@ -152,9 +185,10 @@ class PDFPrepMan(colrev.operation.Operation):
 
     def extract_needs_pdf_prep_man(self) -> None:
         """Apply PDF prep man to csv/bib"""
+        import pandas as pd
 
-        prep_bib_path = self.review_manager.path / Path("data/pdf-prep-records.bib")
-        prep_csv_path = self.review_manager.path / Path("data/pdf-prep-records.csv")
+        prep_bib_path = self.review_manager.path / self.PREP_BIB_FILE_RELATIVE
+        prep_csv_path = self.review_manager.path / self.PREP_CSV_FILE_RELATIVE
 
         if prep_csv_path.is_file():
             print(f"Please rename file to avoid overwriting changes ({prep_csv_path})")
@@ -169,17 +203,19 @@ class PDFPrepMan(colrev.operation.Operation):
         )
         records = self.review_manager.dataset.load_records_dict()
 
+        needs_manual_preparation = (
+            colrev.record.RecordState.pdf_needs_manual_preparation
+        )
         records = {
-            record["ID"]: record
-            for record in records.values()
-            if colrev.record.RecordState.pdf_needs_manual_preparation
-            == record["colrev_status"]
+            record_id: record
+            for record_id, record in records.items()
+            if record["colrev_status"] == needs_manual_preparation
         }
         self.review_manager.dataset.save_records_dict_to_file(
             records=records, save_path=prep_bib_path
         )
 
-        bib_db_df = pd.DataFrame.from_records(list(records.values()))
+        bib_db_df = pd.DataFrame.from_dict(records, orient="index")
 
         # pylint: disable=duplicate-code
         col_names = [
@@ -195,41 +231,49 @@ class PDFPrepMan(colrev.operation.Operation):
             "pages",
             "doi",
         ]
-        for col_name in col_names:
-            if col_name not in bib_db_df:
-                bib_db_df[col_name] = "NA"
-        bib_db_df = bib_db_df[col_names]
+        bib_db_df = bib_db_df.reindex(columns=col_names, fill_value="NA")
 
-        bib_db_df.to_csv(prep_csv_path, index=False)
+        bib_db_df.to_csv(prep_csv_path, index=False, lineterminator="\n")
         self.review_manager.logger.info(f"Created {prep_csv_path.name}")
 
+    @classmethod
+    def __get_origin_key(cls, origin: typing.Any) -> typing.Any:
+        # Note : origins are lists (bib) or strings (csv)
+        return tuple(origin) if isinstance(origin, list) else origin
+
     def apply_pdf_prep_man(self) -> None:
         """Apply PDF prep man from csv/bib"""
+        import pandas as pd
 
-        if Path("data/pdf-prep-records.csv").is_file():
+        if self.PREP_CSV_FILE_RELATIVE.is_file():
             self.review_manager.logger.info("Load prep-records.csv")
-            bib_db_df = pd.read_csv("data/pdf-prep-records.csv")
+            bib_db_df = pd.read_csv(self.PREP_CSV_FILE_RELATIVE)
             records_changed = bib_db_df.to_dict("records")
 
-        if Path("data/pdf-prep-records.bib").is_file():
+        if self.PREP_BIB_FILE_RELATIVE.is_file():
             self.review_manager.logger.info("Load prep-records.bib")
 
-            with open("data/pdf-prep-records.bib", encoding="utf8") as target_db:
+            with open(self.PREP_BIB_FILE_RELATIVE, encoding="utf8") as target_db:
                 records_changed_dict = self.review_manager.dataset.load_records_dict(
                     load_str=target_db.read()
                 )
                 records_changed = list(records_changed_dict.values())
 
+        # Note : index the changed records by origin (instead of a scan per record)
+        changed_records_by_origin: typing.Dict[typing.Any, list] = {}
+        for changed_record in records_changed:
+            changed_records_by_origin.setdefault(
+                self.__get_origin_key(changed_record["colrev_origin"]), []
+            ).append(changed_record)
+
         records = self.review_manager.dataset.load_records_dict()
         for record in records.values():
             # IDs may change - matching based on origins
-            changed_record_l = [
-                x
-                for x in records_changed
-                if x["colrev_origin"] == record["colrev_origin"]
-            ]
+            changed_record_l = changed_records_by_origin.get(
+                self.__get_origin_key(record["colrev_origin"]), []
+            )
             if len(changed_record_l) == 1:
-                changed_record = changed_record_l.pop()
+                changed_record = changed_record_l[0]
                 for key, value in changed_record.items():
                     # if record['ID'] == 'Alter2014':
                     #     print(key, value)
@@ -247,26 +291,32 @@ class PDFPrepMan(colrev.operation.Operation):
     def extract_coverpage(self, *, filepath: Path) -> None:
         """Extract coverpage from PDF"""
 
+        extract_coverpage_to_path(filepath, self.__get_coverpage_path())
+
+    def extract_coverpages(self, *, filepaths: list) -> None:
+        """Extract coverpages from PDFs (in parallel)"""
+
+        if not filepaths:
+            return
+        cp_path = self.__get_coverpage_path()
+        # Note : the PDFs are independent (and parsing them is CPU-bound)
+        with mp.Pool(min(len(filepaths), mp.cpu_count())) as pool:
+            pool.starmap(
+                extract_coverpage_to_path,
+                [(filepath, cp_path) for filepath in filepaths],
+            )
+
+    def __get_coverpage_path(self) -> Path:
         local_index = self.review_manager.get_local_index()
         cp_path = local_index.local_environment_path / Path(".coverpages")
         cp_path.mkdir(exist_ok=True)
-
-        try:
-            pdf_reader = PdfFileReader(str(filepath), strict=False)
-            writer_cp = PdfFileWriter()
-            writer_cp.addPage(pdf_reader.getPage(0))
-            writer = PdfFileWriter()
-            for i in range(1, len(pdf_reader.pages)):
-                writer.addPage(pdf_reader.getPage(i))
-            with open(filepath, "wb") as outfile:
-                writer.write(outfile)
-            with open(cp_path / filepath.name, "wb") as outfile:
-                writer_cp.write(outfile)
-        except PdfReadError as exc:
-            raise colrev_exceptions.InvalidPDFException(filepath) from exc
+        return cp_path
 
     def extract_lastpage(self, *, filepath: Path) -> None:
         """Extract last page from PDF"""
+        from PyPDF2 import PdfFileReader
+        from PyPDF2 import PdfFileWriter
+        from PyPDF2.errors import PdfReadError
 
         local_index = self.review_manager.get_local_index()
         lp_path = local_index.local_environment_path / Path(".lastpages")
@@ -279,15 +329,16 @@ class PDFPrepMan(colrev.operation.Operation):
             writer = PdfFileWriter()
             for i in range(0, len(pdf_reader.pages) - 1):
                 writer.addPage(pdf_reader.getPage(i))
-            with open(filepath, "wb") as outfile:
-                writer.write(outfile)
-            with open(lp_path / filepath.name, "wb") as outfile:
-                writer_lp.write(outfile)
+            write_pdf(writer=writer, filepath=filepath)
+            write_pdf(writer=writer_lp, filepath=lp_path / filepath.name)
         except PdfReadError as exc:
             raise colrev_exceptions.InvalidPDFException(filepath) from exc
 
     def extract_pages(self, *, filepath: Path, pages_to_remove: list) -> None:
         """Extract pages from PDF"""
+        from PyPDF2 import PdfFileReader
+        from PyPDF2 import PdfFileWriter
+        from PyPDF2.errors import PdfReadError
 
         try:
             pdf_reader = PdfFileReader(str(filepath), strict=False)
@@ -299,8 +350,7 @@ class PDFPrepMan(colrev.operation.Operation):
             writer = PdfFileWriter()
             for i in pages_to_add:
                 writer.addPage(pdf_reader.getPage(i))
-            with open(filepath, "wb") as outfile:
-                writer.write(outfile)
+            write_pdf(writer=writer, filepath=filepath)
 
         except PdfReadError as exc:
             raise colrev_exceptions.InvalidPDFException(filepath) from exc
@@ -32,65 +32,82 @@ class PrepMan(colrev.operation.Operation):
         self.verbose = True
 
     def __get_crosstab_df(self) -> pd.DataFrame:
-        # pylint: disable=too-many-branches
         # pylint: disable=duplicate-code
 
         records = self.review_manager.dataset.load_records_dict()
 
         self.review_manager.logger.info("Calculate statistics")
-        stats: dict = {"ENTRYTYPE": {}}
-        overall_types: dict = {"ENTRYTYPE": {}}
-        prep_man_hints, origins, crosstab = [], [], []
-        for record_dict in records.values():
-            if colrev.record.RecordState.md_imported != record_dict["colrev_status"]:
-                if record_dict["ENTRYTYPE"] in overall_types["ENTRYTYPE"]:
-                    overall_types["ENTRYTYPE"][record_dict["ENTRYTYPE"]] = (
-                        overall_types["ENTRYTYPE"][record_dict["ENTRYTYPE"]] + 1
-                    )
-                else:
-                    overall_types["ENTRYTYPE"][record_dict["ENTRYTYPE"]] = 1
-
-            if (
-                colrev.record.RecordState.md_needs_manual_preparation
-                != record_dict["colrev_status"]
-            ):
-                continue
-
-            if record_dict["ENTRYTYPE"] in stats["ENTRYTYPE"]:
-                stats["ENTRYTYPE"][record_dict["ENTRYTYPE"]] = (
-                    stats["ENTRYTYPE"][record_dict["ENTRYTYPE"]] + 1
-                )
-            else:
-                stats["ENTRYTYPE"][record_dict["ENTRYTYPE"]] = 1
+        # Note : the statistics are computed in pandas (instead of per-record dicts)
+        records_df = pd.DataFrame(
+            (
+                (record_dict["colrev_status"], record_dict["ENTRYTYPE"])
+                for record_dict in records.values()
+            ),
+            columns=["colrev_status", "ENTRYTYPE"],
+        )
+        needs_manual_preparation = colrev.record.RecordState.md_needs_manual_preparation
+        overall_types = self.__get_entrytype_counts(
+            entrytypes=records_df.loc[
+                records_df["colrev_status"] != colrev.record.RecordState.md_imported,
+                "ENTRYTYPE",
+            ]
+        )
+        stats = self.__get_entrytype_counts(
+            entrytypes=records_df.loc[
+                records_df["colrev_status"] == needs_manual_preparation, "ENTRYTYPE"
+            ]
+        )
 
-            if "colrev_masterdata_provenance" in record_dict:
-                record = colrev.record.Record(data=record_dict)
-                prov_d = record.data["colrev_masterdata_provenance"]
-                hints = []
-                for key, value in prov_d.items():
-                    if value["note"] != "":
-                        hints.append(f'{key} - {value["note"]}')
-
-                prep_man_hints.append([hint.lstrip() for hint in hints])
-                for hint in hints:
-                    if "change-score" in hint:
-                        continue
-                    # Note: if something causes the needs_manual_preparation
-                    # it is caused by all colrev_origins
-                    for orig in record_dict.get("colrev_origin", ["NA"]):
-                        crosstab.append([orig[: orig.rfind("/")], hint.lstrip()])
-
-            origins.append(
-                [x[: x.rfind("/")] for x in record_dict.get("colrev_origin", ["NA"])]
-            )
+        # Note: if something causes the needs_manual_preparation
+        # it is caused by all colrev_origins
+        needs_prep_records = [
+            record_dict
+            for record_dict in records.values()
+            if record_dict["colrev_status"] == needs_manual_preparation
+            and "colrev_masterdata_provenance" in record_dict
+        ]
+        crosstab_df = pd.DataFrame(
+            {
+                "colrev_origin": [
+                    [
+                        x.rsplit("/", 1)[0]
+                        for x in record_dict.get("colrev_origin", ["NA"])
+                    ]
+                    for record_dict in needs_prep_records
+                ],
+                "hint": [
+                    [
+                        f'{key} - {value["note"]}'
+                        for key, value in record_dict[
+                            "colrev_masterdata_provenance"
+                        ].items()
+                        if value["note"] != ""
+                    ]
+                    for record_dict in needs_prep_records
+                ],
+            },
+            columns=["colrev_origin", "hint"],
+        )
+        crosstab_df = crosstab_df.explode("hint").explode("colrev_origin")
+        crosstab_df = crosstab_df.dropna()
+        if not crosstab_df.empty:
+            crosstab_df["hint"] = crosstab_df["hint"].str.lstrip()
+            crosstab_df = crosstab_df[~crosstab_df["hint"].str.contains("change-score")]
 
         print("Entry type statistics overall:")
-        self.review_manager.p_printer.pprint(overall_types["ENTRYTYPE"])
+        self.review_manager.p_printer.pprint(overall_types)
 
         print("Entry type statistics (needs_manual_preparation):")
-        self.review_manager.p_printer.pprint(stats["ENTRYTYPE"])
+        self.review_manager.p_printer.pprint(stats)
+
+        return crosstab_df.reset_index(drop=True)
 
-        return pd.DataFrame(crosstab, columns=["colrev_origin", "hint"])
+    @classmethod
+    def __get_entrytype_counts(cls, *, entrytypes: pd.Series) -> dict:
+        return {
+            entrytype: int(count)
+            for entrytype, count in entrytypes.value_counts(sort=False).items()
+        }
 
     def prep_man_langs(self) -> None:
         """Add missing language fields based on spreadsheets"""
@@ -187,13 +204,8 @@ class PrepMan(colrev.operation.Operation):
             print("No records to prepare manually.")
         else:
             # pylint: disable=duplicate-code
-            tabulated = pd.pivot_table(
-                crosstab_df[["colrev_origin", "hint"]],
-                index=["colrev_origin"],
-                columns=["hint"],
-                aggfunc=len,
-                fill_value=0,
-                margins=True,
+            tabulated = pd.crosstab(
+                crosstab_df["colrev_origin"], crosstab_df["hint"], margins=True
             )
             # .sort_index(axis='columns')
             tabulated.sort_values(by=["All"], ascending=False, inplace=True)
@@ -212,24 +224,21 @@ class PrepMan(colrev.operation.Operation):
         records_headers = self.review_manager.dataset.load_records_dict(
             header_only=True
         )
-        record_header_list = list(records_headers.values())
-        nr_tasks = len(
-            [
-                x
-                for x in record_header_list
-                if colrev.record.RecordState.md_needs_manual_preparation
-                == x["colrev_status"]
-            ]
-        )
-
-        all_ids = [x["ID"] for x in record_header_list]
-
-        pad = min((max(len(x["ID"]) for x in record_header_list) + 2), 35)
+        needs_manual_preparation = colrev.record.RecordState.md_needs_manual_preparation
+        # Note : the tasks, IDs and the maximum ID length are determined in one pass
+        nr_tasks, max_id_len = 0, 0
+        all_ids = []
+        for record_header in records_headers.values():
+            if record_header["colrev_status"] == needs_manual_preparation:
+                nr_tasks += 1
+            all_ids.append(record_header["ID"])
+            max_id_len = max(max_id_len, len(record_header["ID"]))
+        pad = 0
+        if records_headers:
+            pad = min(max_id_len + 2, 35)
 
         items = self.review_manager.dataset.read_next_record(
-            conditions=[
-                {"colrev_status": colrev.record.RecordState.md_needs_manual_preparation}
-            ]
+            conditions=[{"colrev_status": needs_manual_preparation}]
         )
 
         md_prep_man_data = {
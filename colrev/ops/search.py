@@ -559,6 +559,26 @@ class GeneralOriginFeed:
 
         return added_new
 
+    def add_records(self, *, records: list) -> list:
+        """Set the IDs of records, add them to the feed and set their colrev_origins
+
+        Records that are not feed-identifiable are skipped.
+        Returns a list of (record, added_new, prev_record_dict_version) tuples
+        for the records that were added or updated.
+        """
+
+        results = []
+        for record in records:
+            try:
+                self.set_id(record_dict=record.data)
+            except colrev_exceptions.NotFeedIdentifiableException:
+                continue
+
+            prev_record_dict_version = self.feed_records.get(record.data["ID"], {})
+            added_new = self.add_record(record=record)
+            results.append((record, added_new, prev_record_dict_version))
+        return results
+
     def print_post_run_search_infos(self, *, records: dict) -> None:
         """Print the search infos (after running the search)"""
         if self.nr_added > 0:
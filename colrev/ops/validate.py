@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import datetime
+import heapq
+import multiprocessing as mp
+import operator
 import re
 import typing
 from pathlib import Path
@@ -14,10 +17,23 @@ import colrev.exceptions as colrev_exceptions
 import colrev.operation
 import colrev.record
 
+# Note : parallel computation only pays off for larger numbers of record pairs
+PARALLEL_MIN_RECORD_PAIRS = 256
+
+
+# Note : module-level function (pickle-ability in multiprocessing)
+def get_change_score(change_score_str_pair: tuple) -> float:
+    """Get the change score for a pair of change-score strings"""
+
+    str_a, str_b = change_score_str_pair
+    return colrev.record.Record.get_change_score(str_a=str_a, str_b=str_b)
+
 
 class Validate(colrev.operation.Operation):
     """Validate changes"""
 
+    __commit_message_scopes = {"colrev prep": "prepare", "colrev dedupe": "dedupe"}
+
     def __init__(self, *, review_manager: colrev.review_manager.ReviewManager) -> None:
         super().__init__(
             review_manager=review_manager,
@@ -25,46 +41,100 @@ class Validate(colrev.operation.Operation):
         )
 
         self.cpus = 4
+        self.__prior_records_dicts: typing.Dict[str, dict] = {}
 
     def __load_prior_records_dict(self, *, target_commit: str) -> dict:
-        git_repo = self.review_manager.dataset.get_repo()
+        # Note : the prior records are loaded once per target_commit
+        # (they are used for the preparation and dedupe validation)
+        if target_commit in self.__prior_records_dicts:
+            return self.__prior_records_dicts[target_commit]
 
-        revlist = (
-            (
-                commit.hexsha,
-                (commit.tree / "data" / "records.bib").data_stream.read(),
+        git_repo = self.review_manager.dataset.get_repo()
+        records_file = self.review_manager.dataset.RECORDS_FILE_RELATIVE.as_posix()
+
+        # Note : git log/show are called once (instead of walking commit objects)
+        commit_shas = git_repo.git.log("--format=%H", "--", records_file).split()
+        prior_index = 1
+        if target_commit:
+            # To skip the commits up to the target_commit
+            prior_index = (
+                commit_shas.index(target_commit) + 1
+                if target_commit in commit_shas
+                else len(commit_shas)
             )
-            for commit in git_repo.iter_commits(
-                paths=str(self.review_manager.dataset.RECORDS_FILE_RELATIVE)
+
+        prior_records_dict: dict = {}
+        if prior_index < len(commit_shas):
+            prior_records_dict = self.review_manager.dataset.load_records_dict(
+                load_str=git_repo.git.show(f"{commit_shas[prior_index]}:{records_file}")
             )
-        )
 
-        found_target_commit = False
-        for commit_id, filecontents in list(revlist):
-            if target_commit:
-                if commit_id == target_commit:
-                    found_target_commit = True
-                    continue
-                if not found_target_commit:
+        self.__prior_records_dicts[target_commit] = prior_records_dict
+        return prior_records_dict
+
+    @classmethod
+    def __get_origin_index(cls, *, records_dict: dict) -> typing.Dict[str, list]:
+        # Note : maps each origin to the (position, record) pairs containing it
+        # (to avoid scanning all prior records for each changed record)
+        origin_index: typing.Dict[str, list] = {}
+        for position, record_dict in enumerate(records_dict.values()):
+            for origin in record_dict["colrev_origin"]:
+                origin_index.setdefault(origin, []).append((position, record_dict))
+        return origin_index
+
+    def __get_record_change_scores(self, *, record_pairs: list) -> list:
+        # Note : the strings are created once per record (instead of once per pair)
+        # and only the strings are passed to the processes (instead of the records)
+        change_score_strs: typing.Dict[int, str] = {}
+        for record_pair in record_pairs:
+            for record_dict in record_pair:
+                if id(record_dict) in change_score_strs:
                     continue
-            elif not found_target_commit:
-                # To skip the same commit
-                found_target_commit = True
-                continue
-            prior_records_dict = self.review_manager.dataset.load_records_dict(
-                load_str=filecontents.decode("utf-8")
+                change_score_str = colrev.record.Record.get_change_score_str(
+                    record_dict=record_dict
+                )
+                change_score_strs[id(record_dict)] = change_score_str
+        str_pairs = [
+            (change_score_strs[id(record_a)], change_score_strs[id(record_b)])
+            for record_a, record_b in record_pairs
+        ]
+        if len(str_pairs) < PARALLEL_MIN_RECORD_PAIRS:
+            return list(map(get_change_score, str_pairs))
+
+        # Note: the pairs are independent (and the computation is CPU-bound)
+        with mp.Pool(self.cpus) as pool:
+            return pool.map(
+                get_change_score,
+                str_pairs,
+                chunksize=max(1, len(str_pairs) // (4 * self.cpus)),
             )
-            return prior_records_dict
-        return {}
+
+    @classmethod
+    def __sort_by_change_score(
+        cls, *, change_diff: list, top_k: Optional[int] = None
+    ) -> list:
+        # sort according to similarity
+        if top_k is None:
+            change_diff.sort(key=operator.itemgetter("change_score"), reverse=True)
+            return change_diff
+        # Note : heapq.nlargest (instead of a full sort) when only the top_k are needed
+        return heapq.nlargest(
+            top_k, change_diff, key=operator.itemgetter("change_score")
+        )
 
     def validate_preparation_changes(
-        self, *, records: list[dict], prior_records_dict: dict
+        self,
+        *,
+        records: list[dict],
+        prior_records_dict: dict,
+        top_k: Optional[int] = None,
     ) -> list:
         """Validate preparation changes"""
 
         self.review_manager.logger.debug("Calculating preparation differences...")
         change_diff = []
-        covered_ids = []
+        covered_ids: typing.Set[str] = set()
+        origin_index = self.__get_origin_index(records_dict=prior_records_dict)
         for record_dict in records:
             if "changed_in_target_commit" not in record_dict:
                 continue
@@ -75,31 +145,28 @@ class Validate(colrev.operation.Operation):
             )
             del record_dict["colrev_status"]
             for cur_record_link in record_dict["colrev_origin"]:
-                prior_records = [
-                    x
-                    for x in prior_records_dict.values()
-                    if cur_record_link in x["colrev_origin"]
-                ]
-                for prior_record_dict in prior_records:
-                    change_score = colrev.record.Record.get_record_change_score(
-                        record_a=colrev.record.Record(data=record_dict),
-                        record_b=colrev.record.Record(data=prior_record_dict),
-                    )
+                for _, prior_record_dict in origin_index.get(cur_record_link, []):
                     if record_dict["ID"] not in covered_ids:
                         change_diff.append(
                             {
                                 "prior_record_dict": prior_record_dict,
                                 "record_dict": record_dict,
-                                "change_score": change_score,
                                 "prescreen_exclusion_mark": prescreen_excluded,
                             }
                         )
-                        covered_ids.append(record_dict["ID"])
-
-        # sort according to similarity
-        change_diff.sort(key=lambda x: x["change_score"], reverse=True)
+                        covered_ids.add(record_dict["ID"])
+
+        # Note : the change scores are computed for all pairs at once
+        change_scores = self.__get_record_change_scores(
+            record_pairs=[
+                (change["record_dict"], change["prior_record_dict"])
+                for change in change_diff
+            ]
+        )
+        for change, change_score in zip(change_diff, change_scores):
+            change["change_score"] = change_score
 
-        return change_diff
+        return self.__sort_by_change_score(change_diff=change_diff, top_k=top_k)
 
     def __export_merge_candidates_file(self, *, records: list[dict]) -> None:
         merge_candidates_file = Path("data/dedupe/merge_candidates_file.txt")
@@ -132,7 +199,7 @@ class Validate(colrev.operation.Operation):
             merge_candidates_file.unlink()
 
     def validate_dedupe_changes(
-        self, *, records: list[dict], target_commit: str
+        self, *, records: list[dict], target_commit: str, top_k: Optional[int] = None
     ) -> list:
         """Validate dedupe changes"""
 
@@ -141,8 +208,9 @@ class Validate(colrev.operation.Operation):
 
         prior_records_dict = self.__load_prior_records_dict(target_commit=target_commit)
 
-        change_diff = []
+        merged_record_pairs = []
         merged_records = False
+        origin_index = self.__get_origin_index(records_dict=prior_records_dict)
         for record in records:
             if "changed_in_target_commit" not in record:
                 continue
@@ -152,15 +220,17 @@ class Validate(colrev.operation.Operation):
                 continue
             merged_records = True
 
-            merged_records_list = []
-
-            for prior_record in prior_records_dict.values():
-                if len(prior_record["colrev_origin"]) == 1:
-                    continue
-                if any(
-                    o in record["colrev_origin"] for o in prior_record["colrev_origin"]
-                ):
-                    merged_records_list.append(prior_record)
+            # Note : the prior records sharing an origin (in their prior order)
+            merged_records_by_position = {
+                position: prior_record
+                for origin in record["colrev_origin"]
+                for position, prior_record in origin_index.get(origin, [])
+                if len(prior_record["colrev_origin"]) > 1
+            }
+            merged_records_list = [
+                merged_records_by_position[position]
+                for position in sorted(merged_records_by_position)
+            ]
 
             if len(merged_records_list) < 2:
                 # merged records not found
@@ -169,23 +239,26 @@ class Validate(colrev.operation.Operation):
             reference_record = merged_records_list.pop(0)
             # Note : should usually be only one merged_rec (but multiple-merges are possible)
             for merged_rec in merged_records_list:
-                change_score = colrev.record.Record.get_record_change_score(
-                    record_a=colrev.record.Record(data=reference_record),
-                    record_b=colrev.record.Record(data=merged_rec),
-                )
-                change_diff.append(
+                merged_record_pairs.append(
                     {
                         "record": record,
                         "prior_record_a": reference_record,
                         "prior_record_b": merged_rec,
-                        "change_score": change_score,
                     }
                 )
 
-        change_diff = [
-            element for element in change_diff if element["change_score"] < 1
-        ]
-        if 0 == len(change_diff):
+        change_scores = self.__get_record_change_scores(
+            record_pairs=[
+                (change["prior_record_a"], change["prior_record_b"])
+                for change in merged_record_pairs
+            ]
+        )
+        change_diff = []
+        for change, change_score in zip(merged_record_pairs, change_scores):
+            if change_score < 1:
+                change["change_score"] = change_score
+                change_diff.append(change)
+        if not change_diff:
             if merged_records:
                 self.review_manager.logger.info("No substantial differences found.")
             else:
@@ -193,10 +266,7 @@ class Validate(colrev.operation.Operation):
 
         self.__export_merge_candidates_file(records=records)
 
-        # sort according to similarity
-        change_diff.sort(key=lambda x: x["change_score"], reverse=True)
-
-        return change_diff
+        return self.__sort_by_change_score(change_diff=change_diff, top_k=top_k)
 
     def load_changed_records(
         self, *, target_commit: Optional[str] = None
@@ -237,6 +307,8 @@ class Validate(colrev.operation.Operation):
         if not commit == cur_sha:
             self.review_manager.logger.info(f"Check out target_commit = {commit}")
             git_repo.git.checkout(commit)
+            # Note : the prior records of the default ("") target depend on HEAD
+            self.__prior_records_dicts.clear()
 
         ret = self.review_manager.check_repo()
         if 0 == ret["status"]:
@@ -259,45 +331,23 @@ class Validate(colrev.operation.Operation):
         return validation_details
 
     def __set_scope_based_on_target_commit(self, *, target_commit: str) -> str:
-        # pylint: disable=too-many-branches
-
         if not target_commit:
             target_commit = self.review_manager.dataset.get_last_commit_sha()
 
         git_repo = self.review_manager.dataset.get_repo()
 
-        revlist = list(
-            (
-                commit.hexsha,
-                commit.message,
-            )
-            for commit in git_repo.iter_commits()
-        )
-
         scope = ""
         # Note : simple heuristic: commit messages
-        for commit_id, msg in revlist:
-            if commit_id == target_commit:
-                if "colrev prep" in msg:
-                    scope = "prepare"
-                elif "colrev dedupe" in msg:
-                    scope = "dedupe"
-                elif any(
-                    x in msg
-                    for x in [
-                        "colrev init",
-                        "colrev load",
-                        "colrev pdf-get",
-                        "colrev pdf-prep",
-                        "colrev screen",
-                        "colrev prescreen",
-                    ]
-                ):
-                    scope = "general"
-                else:
-                    scope = "general"
-            if scope != "":
-                break
+        # (the message is only read for the target commit)
+        for commit in git_repo.iter_commits():
+            if commit.hexsha != target_commit:
+                continue
+            scope = "general"
+            for command, command_scope in self.__commit_message_scopes.items():
+                if command in commit.message:
+                    scope = command_scope
+                    break
+            break
 
         # Otherwise: compare records
         if scope in ["general"]:
@@ -418,29 +468,28 @@ class Validate(colrev.operation.Operation):
         if scope.startswith("HEAD~"):
             assert scope.replace("HEAD~", "").isdigit()
             back_count = int(scope.replace("HEAD~", ""))
-            for commit_item in git_repo.iter_commits():
-                if back_count == 0:
-                    commit = commit_item.hexsha
-                    break
-                back_count -= 1
+            # Note : rev-list skips the commits (instead of iterating them in python)
+            for commit_item in git_repo.iter_commits(skip=back_count, max_count=1):
+                commit = commit_item.hexsha
         else:
-            valid_options = []
-
             try:
                 commit_object = git_repo.commit(scope)
                 commit = commit_object.hexsha
             except ValueError:
-                for commit_candidate in git_repo.iter_commits():
-                    if str(commit_candidate.tree) == scope:
-                        commit = commit_candidate.hexsha
-                        break
-                    valid_options.append(str(commit_candidate.tree))
+                # Note : one git-log call (instead of reading each commit object)
+                commits_by_tree: typing.Dict[str, str] = {}
+                for line in git_repo.git.log("--format=%T %H").splitlines():
+                    tree_hash, commit_sha = line.split(" ")
+                    commits_by_tree.setdefault(tree_hash, commit_sha)
 
-                if commit == "":
+                if scope not in commits_by_tree:
                     # pylint: disable=raise-missing-from
                     raise colrev_exceptions.ParameterError(
-                        parameter="validate.scope", value=scope, options=valid_options
+                        parameter="validate.scope",
+                        value=scope,
+                        options=list(commits_by_tree),
                     )
+                commit = commits_by_tree[scope]
 
         if not re.match(r"[0-9a-f]{5,40}", commit):
             raise colrev_exceptions.ParameterError(
@@ -453,9 +502,9 @@ class Validate(colrev.operation.Operation):
     def __deduplicated_records(
         self, *, records: list[dict], prior_records_dict: dict
     ) -> bool:
-        return {",".join(sorted(x)) for x in [r["colrev_origin"] for r in records]} != {
-            ",".join(sorted(x))
-            for x in [r["colrev_origin"] for r in prior_records_dict.values()]
+        # Note : origin-sets are compared as frozensets (instead of sorting and joining)
+        return {frozenset(r["colrev_origin"]) for r in records} != {
+            frozenset(r["colrev_origin"]) for r in prior_records_dict.values()
         }
 
     def __get_contributor_validation(self, *, contributor: str) -> dict:
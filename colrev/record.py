@@ -5,6 +5,7 @@ from __future__ import annotations
 import difflib
 import io
 import logging
+import math
 import pprint
 import re
 import textwrap
@@ -913,20 +914,33 @@ class Record:
         records, get_similarity will return a value > 1.0. The get_record_changes
         will return 0.0 (if all other fields are equal)."""
 
-        # At some point, this may become more sensitive to major changes
-        str_a = (
-            f"{record_a.data.get('author', '')} ({record_a.data.get('year', '')}) "
-            + f"{record_a.data.get('title', '')}. "
-            + f"{record_a.data.get('journal', '')}{record_a.data.get('booktitle', '')}, "
-            + f"{record_a.data.get('volume', '')} ({record_a.data.get('number', '')})"
-        )
-        str_b = (
-            f"{record_b.data.get('author', '')} ({record_b.data.get('year', '')}) "
-            + f"{record_b.data.get('title', '')}. "
-            + f"{record_b.data.get('journal', '')}{record_b.data.get('booktitle', '')}, "
-            + f"{record_b.data.get('volume', '')} ({record_b.data.get('number', '')})"
+        return cls.get_change_score(
+            str_a=cls.get_change_score_str(record_dict=record_a.data),
+            str_b=cls.get_change_score_str(record_dict=record_b.data),
         )
-        return 1 - fuzz.ratio(str_a.lower(), str_b.lower()) / 100
+
+    @classmethod
+    def get_change_score_str(cls, *, record_dict: dict) -> str:
+        """Get the (lower-case) string of a record that is compared in the change score"""
+
+        # At some point, this may become more sensitive to major changes
+        return (
+            f"{record_dict.get('author', '')} ({record_dict.get('year', '')}) "
+            + f"{record_dict.get('title', '')}. "
+            + f"{record_dict.get('journal', '')}{record_dict.get('booktitle', '')}, "
+            + f"{record_dict.get('volume', '')} ({record_dict.get('number', '')})"
+        ).lower()
+
+    @classmethod
+    def get_change_score(cls, *, str_a: str, str_b: str) -> float:
+        """Determine the change score of two change-score strings
+
+        The strings are created by get_change_score_str()."""
+
+        # Note : unchanged records do not require the fuzzy comparison
+        if str_a == str_b:
+            return 0.0
+        return 1 - fuzz.ratio(str_a, str_b) / 100
 
     @classmethod
     def get_record_similarity(cls, *, record_a: Record, record_b: Record) -> float:
@@ -973,113 +987,152 @@ class Record:
     @classmethod
     def get_similarity(cls, *, df_a: dict, df_b: dict) -> float:
         """Determine the similarity between two records"""
+        try:
+            _, similarities, weights = cls.__get_similarities(
+                record_a=df_a, record_b=df_b
+            )
+        except AttributeError:
+            return 0
+        # Note: the details (string) are not needed to determine the score
+        return cls.__get_weighted_average(similarities=similarities, weights=weights)
 
-        details = Record.get_similarity_detailed(record_a=df_a, record_b=df_b)
-        return details["score"]
+    @classmethod
+    def __get_ratio_upper_bound(cls, str_a: str, str_b: str) -> int:
+        # Note: fuzz.ratio() corresponds to 2*M/T, with the number of matches (M)
+        # being limited by the shorter string and T being the total length
+        len_a, len_b = len(str(str_a)), len(str(str_b))
+        if len_a + len_b == 0:
+            return 100
+        return math.ceil(200 * min(len_a, len_b) / (len_a + len_b))
 
     @classmethod
-    def get_similarity_detailed(cls, *, record_a: dict, record_b: dict) -> dict:
-        """Determine the detailed similarities between records"""
-        try:
-            author_similarity = fuzz.ratio(record_a["author"], record_b["author"]) / 100
+    def get_similarity_upper_bound(cls, *, df_a: dict, df_b: dict) -> float:
+        """Determine an upper bound of the similarity between two records
 
-            title_similarity = (
-                fuzz.ratio(
-                    record_a["title"].lower().replace(":", "").replace("-", ""),
-                    record_b["title"].lower().replace(":", "").replace("-", ""),
-                )
-                / 100
+        The bound only considers the lengths of the fields (which is much cheaper
+        than the fuzzy comparison in get_similarity()).
+        """
+        try:
+            _, similarities, weights = cls.__get_similarities(
+                record_a=df_a, record_b=df_b, ratio=cls.__get_ratio_upper_bound
             )
+        except AttributeError:
+            return 0
+        return cls.__get_weighted_average(similarities=similarities, weights=weights)
+
+    @classmethod
+    def __get_weighted_average(cls, *, similarities: list, weights: list) -> float:
+        weighted_average = sum(
+            similarities[g] * weights[g] for g in range(len(similarities))
+        )
+        return round(weighted_average, 4)
 
-            # partial ratio (catching 2010-10 or 2001-2002)
-            year_similarity = (
-                fuzz.ratio(str(record_a["year"]), str(record_b["year"])) / 100
+    @classmethod
+    def __get_similarities(
+        cls,
+        *,
+        record_a: dict,
+        record_b: dict,
+        ratio: typing.Callable = fuzz.ratio,
+    ) -> typing.Tuple[list, list, list]:
+        """Determine the field similarities (names, similarities, weights)"""
+        author_similarity = ratio(record_a["author"], record_b["author"]) / 100
+
+        title_similarity = (
+            ratio(
+                record_a["title"].lower().replace(":", "").replace("-", ""),
+                record_b["title"].lower().replace(":", "").replace("-", ""),
             )
+            / 100
+        )
 
-            outlet_similarity = 0.0
-            if record_b["container_title"] and record_a["container_title"]:
-                outlet_similarity = (
-                    fuzz.ratio(record_a["container_title"], record_b["container_title"])
-                    / 100
-                )
+        # partial ratio (catching 2010-10 or 2001-2002)
+        year_similarity = ratio(str(record_a["year"]), str(record_b["year"])) / 100
 
-            if str(record_a["journal"]) != "nan":
-                # Note: for journals papers, we expect more details
-                volume_similarity = (
-                    1 if (record_a["volume"] == record_b["volume"]) else 0
-                )
+        outlet_similarity = 0.0
+        if record_b["container_title"] and record_a["container_title"]:
+            outlet_similarity = (
+                ratio(record_a["container_title"], record_b["container_title"]) / 100
+            )
 
-                number_similarity = (
-                    1 if (record_a["number"] == record_b["number"]) else 0
-                )
+        if str(record_a["journal"]) != "nan":
+            # Note: for journals papers, we expect more details
+            volume_similarity = 1 if (record_a["volume"] == record_b["volume"]) else 0
+
+            number_similarity = 1 if (record_a["number"] == record_b["number"]) else 0
+
+            # page similarity is not considered at the moment.
+            #
+            # sometimes, only the first page is provided.
+            # if str(record_a["pages"]) == "nan" or str(record_b["pages"]) == "nan":
+            #     pages_similarity = 1
+            # else:
+            #     if record_a["pages"] == record_b["pages"]:
+            #         pages_similarity = 1
+            #     else:
+            #         if record_a["pages"].split("-")[0] == record_b["pages"].split("-")[0]:
+            #             pages_similarity = 1
+            #         else:
+            #            pages_similarity = 0
+
+            # Put more weight on other fields if the title is very common
+            # ie., non-distinctive
+            # The list is based on a large export of distinct papers, tabulated
+            # according to titles and sorted by frequency
+            if [record_a["title"], record_b["title"]] in [
+                ["editorial", "editorial"],
+                ["editorial introduction", "editorial introduction"],
+                ["editorial notes", "editorial notes"],
+                ["editor's comments", "editor's comments"],
+                ["book reviews", "book reviews"],
+                ["editorial note", "editorial note"],
+                ["reviewer ackowledgment", "reviewer ackowledgment"],
+            ]:
+                weights = [0.175, 0, 0.175, 0.175, 0.275, 0.2]
+            else:
+                weights = [0.2, 0.25, 0.13, 0.2, 0.12, 0.1]
+
+            sim_names = [
+                "authors",
+                "title",
+                "year",
+                "outlet",
+                "volume",
+                "number",
+            ]
+            similarities = [
+                author_similarity,
+                title_similarity,
+                year_similarity,
+                outlet_similarity,
+                volume_similarity,
+                number_similarity,
+            ]
 
-                # page similarity is not considered at the moment.
-                #
-                # sometimes, only the first page is provided.
-                # if str(record_a["pages"]) == "nan" or str(record_b["pages"]) == "nan":
-                #     pages_similarity = 1
-                # else:
-                #     if record_a["pages"] == record_b["pages"]:
-                #         pages_similarity = 1
-                #     else:
-                #         if record_a["pages"].split("-")[0] == record_b["pages"].split("-")[0]:
-                #             pages_similarity = 1
-                #         else:
-                #            pages_similarity = 0
-
-                # Put more weight on other fields if the title is very common
-                # ie., non-distinctive
-                # The list is based on a large export of distinct papers, tabulated
-                # according to titles and sorted by frequency
-                if [record_a["title"], record_b["title"]] in [
-                    ["editorial", "editorial"],
-                    ["editorial introduction", "editorial introduction"],
-                    ["editorial notes", "editorial notes"],
-                    ["editor's comments", "editor's comments"],
-                    ["book reviews", "book reviews"],
-                    ["editorial note", "editorial note"],
-                    ["reviewer ackowledgment", "reviewer ackowledgment"],
-                ]:
-                    weights = [0.175, 0, 0.175, 0.175, 0.275, 0.2]
-                else:
-                    weights = [0.2, 0.25, 0.13, 0.2, 0.12, 0.1]
-
-                sim_names = [
-                    "authors",
-                    "title",
-                    "year",
-                    "outlet",
-                    "volume",
-                    "number",
-                ]
-                similarities = [
-                    author_similarity,
-                    title_similarity,
-                    year_similarity,
-                    outlet_similarity,
-                    volume_similarity,
-                    number_similarity,
-                ]
+        else:
+            weights = [0.15, 0.75, 0.05, 0.05]
+            sim_names = [
+                "author",
+                "title",
+                "year",
+                "outlet",
+            ]
+            similarities = [
+                author_similarity,
+                title_similarity,
+                year_similarity,
+                outlet_similarity,
+            ]
 
-            else:
-                weights = [0.15, 0.75, 0.05, 0.05]
-                sim_names = [
-                    "author",
-                    "title",
-                    "year",
-                    "outlet",
-                ]
-                similarities = [
-                    author_similarity,
-                    title_similarity,
-                    year_similarity,
-                    outlet_similarity,
-                ]
+        return sim_names, similarities, weights
 
-            weighted_average = sum(
-                similarities[g] * weights[g] for g in range(len(similarities))
+    @classmethod
+    def get_similarity_detailed(cls, *, record_a: dict, record_b: dict) -> dict:
+        """Determine the detailed similarities between records"""
+        try:
+            sim_names, similarities, weights = cls.__get_similarities(
+                record_a=record_a, record_b=record_b
             )
-
             details = (
                 "["
                 + ",".join([sim_names[g] for g in range(len(similarities))])
@@ -1092,7 +1145,9 @@ class Record:
                 + ",".join([str(weights[g]) for g in range(len(similarities))])
                 + "]^T"
             )
-            similarity_score = round(weighted_average, 4)
+            similarity_score = cls.__get_weighted_average(
+                similarities=similarities, weights=weights
+            )
         except AttributeError:
             similarity_score = 0
             details = ""
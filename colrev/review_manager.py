@@ -451,11 +451,18 @@ class ReviewManager:
     def get_cached_session(cls) -> requests_cache.CachedSession:
         """Get a cached session"""
 
-        return requests_cache.CachedSession(
+        session = requests_cache.CachedSession(
             str(colrev.env.environment_manager.EnvironmentManager.cache_path),
             backend="sqlite",
             expire_after=timedelta(days=30),
+            # Note : wait for concurrent writers (instead of raising OperationalError)
+            timeout=30,
         )
+        # Note : write-ahead logging allows concurrent reads while responses are
+        # written (e.g., by the threads of prep or search). The mode is persistent.
+        with session.cache.responses.connection(commit=True) as con:
+            con.execute("PRAGMA journal_mode=WAL")
+        return session
 
     @classmethod
     def get_zotero_translation_service(
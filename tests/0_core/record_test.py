@@ -880,6 +880,34 @@ def test_get_record_similarity() -> None:
     assert expected == actual
 
 
+def test_get_similarity_upper_bound() -> None:
+    """Test record.get_similarity_upper_bound()"""
+
+    record_a = {**v1, "container_title": v1["journal"]}
+    record_b = {**v2, "container_title": v2["journal"]}
+    similarity = colrev.record.Record.get_similarity(df_a=record_a, df_b=record_b)
+    upper_bound = colrev.record.Record.get_similarity_upper_bound(
+        df_a=record_a, df_b=record_b
+    )
+    assert similarity <= upper_bound <= 1.0
+
+
+def test_get_record_change_score() -> None:
+    """Test record.get_record_change_score()"""
+
+    assert 0.0 == colrev.record.Record.get_record_change_score(
+        record_a=r1, record_b=r1.copy()
+    )
+    change_score = colrev.record.Record.get_record_change_score(
+        record_a=r1, record_b=r2
+    )
+    assert 0.0 < change_score < 1.0
+    assert change_score == colrev.record.Record.get_change_score(
+        str_a=colrev.record.Record.get_change_score_str(record_dict=v1),
+        str_b=colrev.record.Record.get_change_score_str(record_dict=v2),
+    )
+
+
 def test_merge_select_non_all_caps() -> None:
     """Test record.merge() - all-caps cases"""
     # Select title-case (not all-caps title) and full author name
@@ -32,6 +32,23 @@ def test_search_feed(  # type: ignore
     search_feed.add_record(record=colrev.record.Record(data=record_dict))
     assert len(search_feed.feed_records) == 1
 
+    results = search_feed.add_records(
+        records=[
+            colrev.record.Record(data={"ID": "0002", "ENTRYTYPE": "article"}),
+            colrev.record.Record(
+                data={"ID": "0003", "ENTRYTYPE": "article", "doi": "10.111/3333"}
+            ),
+            colrev.record.Record(
+                data={"ID": "0004", "ENTRYTYPE": "article", "doi": "10.111/3333"}
+            ),
+        ]
+    )
+    assert [(added, prev) for _, added, prev in results] == [
+        (True, {}),
+        (False, {"ID": "000002", "ENTRYTYPE": "article", "doi": "10.111/3333"}),
+    ]
+    assert len(search_feed.feed_records) == 2
+
     search_feed.print_post_run_search_infos(records={})
     search_feed.save_feed_file()
     base_repo_review_manager.create_commit(msg="test")
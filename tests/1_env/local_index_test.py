@@ -11,32 +11,35 @@ import colrev.review_manager
 # pylint: disable=line-too-long
 
 
-def test_is_duplicate(local_index, local_index_test_records_dict) -> None:  # type: ignore
-    """Test is_duplicate()"""
-    record1_colrev_id = colrev.record.Record(
-        data=local_index_test_records_dict[Path("misq.bib")]["AbbasZhouDengEtAl2018"]
-    ).get_colrev_id()
-    record2_colrev_id = colrev.record.Record(
-        data=local_index_test_records_dict[Path("misq.bib")][
-            "AbbasiAlbrechtVanceEtAl2012"
-        ]
-    ).get_colrev_id()
-    expected = "no"
-    actual = local_index.is_duplicate(
-        record1_colrev_id=record1_colrev_id, record2_colrev_id=record2_colrev_id
-    )
-    assert expected == actual
+@pytest.fixture(scope="module", name="misq_colrev_ids")
+def fixture_misq_colrev_ids(local_index_test_records_dict) -> dict:  # type: ignore
+    """Fixture returning the colrev_ids of the misq.bib test records"""
+    return {
+        record_id: colrev.record.Record(data=record_dict).get_colrev_id()
+        for record_id, record_dict in local_index_test_records_dict[
+            Path("misq.bib")
+        ].items()
+    }
 
-    expected = "yes"
-    actual = local_index.is_duplicate(
-        record1_colrev_id=record1_colrev_id, record2_colrev_id=record1_colrev_id
-    )
-    assert expected == actual
 
-    expected = "unknown"
+@pytest.mark.parametrize(
+    "record2_colrev_id, expected",
+    [
+        ("AbbasiAlbrechtVanceEtAl2012", "no"),
+        ("AbbasZhouDengEtAl2018", "yes"),
+        (["colrev_id1:|a|mis-quarterly|45|1|2020|rai|editorial"], "unknown"),
+    ],
+)
+def test_is_duplicate(  # type: ignore
+    local_index, misq_colrev_ids, record2_colrev_id, expected: str
+) -> None:
+    """Test is_duplicate()"""
+    if isinstance(record2_colrev_id, str):
+        record2_colrev_id = misq_colrev_ids[record2_colrev_id]
+
     actual = local_index.is_duplicate(
-        record1_colrev_id=record1_colrev_id,
-        record2_colrev_id=["colrev_id1:|a|mis-quarterly|45|1|2020|rai|editorial"],
+        record1_colrev_id=misq_colrev_ids["AbbasZhouDengEtAl2018"],
+        record2_colrev_id=record2_colrev_id,
     )
     assert expected == actual
 
@@ -61,12 +64,12 @@ def test_get_year_from_toc(local_index) -> None:  # type: ignore
     assert expected == actual
 
 
-def test_search(local_index) -> None:  # type: ignore
-    """Test search()"""
-
-    expected = [
-        colrev.record.Record(
-            data={
+@pytest.mark.parametrize(
+    "query, expected_dict",
+    [
+        (
+            "title LIKE '%social media%'",
+            {
                 "ENTRYTYPE": "article",
                 "ID": "AbbasZhouDengEtAl2018",
                 "author": "Abbas, Ahmed and Zhou, Yilu and Deng, Shasha and Zhang, Pengzhu",
@@ -88,15 +91,11 @@ def test_search(local_index) -> None:  # type: ignore
                 "url": "https://misq.umn.edu/skin/frontend/default/misq/pdf/appendices/2018/V42I2Appendices/04_13239_RA_AbbasiZhou.pdf",
                 "volume": "42",
                 "year": "2018",
-            }
-        )
-    ]
-    actual = local_index.search(query="title LIKE '%social media%'")
-    assert expected == actual
-
-    expected = [
-        colrev.record.Record(
-            data={
+            },
+        ),
+        (
+            "title LIKE '%Knowledge Management and Knowledge Management Systems%'",
+            {
                 "ENTRYTYPE": "article",
                 "ID": "AlaviLeidner2001",
                 "author": "Alavi, Maryam and Leidner, Dorothy E.",
@@ -118,12 +117,15 @@ def test_search(local_index) -> None:  # type: ignore
                 "url": "https://www.doi.org/10.2307/3250961",
                 "volume": "25",
                 "year": "2001",
-            }
-        )
-    ]
-    actual = local_index.search(
-        query="title LIKE '%Knowledge Management and Knowledge Management Systems%'"
-    )
+            },
+        ),
+    ],
+)
+def test_search(local_index, query: str, expected_dict: dict) -> None:  # type: ignore
+    """Test search()"""
+
+    expected = [colrev.record.Record(data=expected_dict)]
+    actual = local_index.search(query=query)
     assert expected == actual
 
 
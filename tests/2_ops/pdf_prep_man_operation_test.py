@@ -1,5 +1,11 @@
 #!/usr/bin/env python
 """Tests of the CoLRev pdf-prep-man operation"""
+from pathlib import Path
+
+import pytest
+
+import colrev.env.local_index
+import colrev.exceptions as colrev_exceptions
 import colrev.review_manager
 
 
@@ -16,3 +22,34 @@ def test_pdf_prep_man(  # type: ignore
     pdf_prep_man_operation.pdf_prep_man_stats()
     pdf_prep_man_operation.extract_needs_pdf_prep_man()
     pdf_prep_man_operation.discard()
+
+
+def test_extract_coverpages(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager,
+    helpers,
+    mocker,
+    tmp_path,
+) -> None:
+    """Test the (parallel) extraction of coverpages"""
+
+    mocker.patch.object(
+        colrev.env.local_index.LocalIndex, "local_environment_path", tmp_path
+    )
+    pdf_prep_man_operation = base_repo_review_manager.get_pdf_prep_man_operation()
+
+    filepaths = [tmp_path / Path(f"paper_{i}.pdf") for i in range(3)]
+    for filepath in filepaths:
+        helpers.retrieve_test_file(
+            source=Path("WagnerLukyanenkoParEtAl2022.pdf"), target=filepath
+        )
+    pdf_prep_man_operation.extract_coverpages(filepaths=filepaths)
+    for filepath in filepaths:
+        assert (tmp_path / Path(".coverpages") / filepath.name).is_file()
+
+    broken_filepath = tmp_path / Path("broken-pdf.pdf")
+    helpers.retrieve_test_file(source=Path("broken-pdf.pdf"), target=broken_filepath)
+    with pytest.raises(colrev_exceptions.InvalidPDFException) as exc_info:
+        pdf_prep_man_operation.extract_coverpages(
+            filepaths=[filepaths[0], broken_filepath]
+        )
+    assert str(exc_info.value) == f"Invalid PDF (empty/broken): {broken_filepath}"
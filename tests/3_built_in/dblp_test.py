@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+"""Test the DBLP search source"""
+from copy import deepcopy
+
+import colrev.ops.built_in.search_sources.dblp
+
+
+def test_get_page_digest() -> None:
+    """Test get_page_digest()"""
+
+    page = {
+        "result": {
+            "query": "MIS Quarterly 2018*",
+            "status": {"@code": "200", "text": "OK"},
+            "time": {"@unit": "msecs", "text": "12.34"},
+            "completions": {"@total": "0", "@computed": "0", "@sent": "0"},
+            "hits": {
+                "@total": "1",
+                "@computed": "1",
+                "@sent": "1",
+                "@first": "0",
+                "hit": [
+                    {
+                        "@score": "1",
+                        "@id": "1",
+                        "info": {
+                            "title": "Text Analytics to Support Sense-Making in Social Media.",
+                            "venue": "MIS Q.",
+                            "volume": "42",
+                            "number": "2",
+                            "year": "2018",
+                            "type": "Journal Articles",
+                            "key": "journals/misq/AbbasiZDZ18",
+                        },
+                        "url": "URL#1",
+                    }
+                ],
+            },
+        }
+    }
+    dblp_search_source = colrev.ops.built_in.search_sources.dblp.DBLPSearchSource
+
+    rerun_page = deepcopy(page)
+    rerun_page["result"]["time"]["text"] = "56.78"
+    assert dblp_search_source.get_page_digest(
+        page=page
+    ) == dblp_search_source.get_page_digest(page=rerun_page)
+
+    changed_page = deepcopy(page)
+    changed_page["result"]["hits"]["hit"][0]["info"]["number"] = "3"
+    assert dblp_search_source.get_page_digest(
+        page=page
+    ) != dblp_search_source.get_page_digest(page=changed_page)
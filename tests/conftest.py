@@ -56,6 +56,9 @@ class Helpers:
             commit_id = commit_sha
         elif commit:
             commit_id = getattr(review_manager, commit)
+        # Note : skip the (hard) reset if the clean working tree is already at the commit
+        if repo.head.commit.hexsha == commit_id and not repo.is_dirty():
+            return
         repo.head.reset(commit_id, index=True, working_tree=True)
 
 